@@ -0,0 +1,41 @@
+"""
+File helpers shared by the master_output.md clean-up scripts
+"""
+
+import contextlib
+import mmap
+import os
+import shutil
+import tempfile
+
+@contextlib.contextmanager
+def atomic_write(path, mode='w', **kwargs):
+    """
+    Yield a temp file next to path, opened with mode and kwargs, to write the
+    new contents of path to; when the block completes the temp file takes
+    path's permissions and is swapped into its place, so a crash never leaves
+    path half-written. On error the temp file is removed and path untouched
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                               suffix=os.path.splitext(path)[1])
+    try:
+        with os.fdopen(fd, mode, **kwargs) as f:
+            yield f
+        shutil.copymode(path, tmp)  # mkstemp creates the file 0600
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+@contextlib.contextmanager
+def mapped(path):
+    """
+    Yield the contents of path as a read-only memory map, or as b'' when the
+    file is empty, since an empty file cannot be mapped
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            yield content
@@ -8,12 +8,24 @@ import re
 import os
 from pathlib import Path
 
-def find_pattern_name_before_line(lines, line_num):
-    """Find the pattern name by looking backward for ## CONTINUED: header"""
-    for i in range(line_num - 1, max(0, line_num - 1000), -1):
-        if lines[i].startswith('## CONTINUED:'):
-            return lines[i]
-    return None
+# "## Python Architecture Diagram Snippet" heading lines
+_SNIPPET_HEADING_RE = re.compile(
+    r'^[^\S\n]*## Python Architecture Diagram Snippet[^\S\n]*$', re.MULTILINE)
+
+# An empty "## Python Architecture Diagram Snippet" section: the heading
+# line, then a blank line (group 'blank') where the code belongs
+_EMPTY_SNIPPET_RE = re.compile(
+    r'^[^\S\n]*## Python Architecture Diagram Snippet[^\S\n]*\n'
+    r'(?P<blank>[^\S\n]*\n|[^\S\n]+\Z)',
+    re.MULTILINE)
+
+def find_pattern_name_before_line(text, pos):
+    """Find the pattern name by looking backward from offset pos for the
+    nearest ## CONTINUED: header line, at most 999 lines back"""
+    start = text.rfind('\n## CONTINUED:', 0, pos) + 1
+    if not start or text.count('\n', start, pos) >= 1000:
+        return None
+    return text[start:text.index('\n', start) + 1]
 
 def pattern_name_to_filename(pattern_header):
     """Convert pattern header to Python filename"""
@@ -67,66 +79,67 @@ def main():
     diagrams_dir = base_dir / 'build' / 'diagrams'
     
     print(f"Reading {master_file}...")
-    with open(master_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    text = master_file.read_text(encoding='utf-8')
     
-    # Find all "## Python Architecture Diagram Snippet" sections
-    snippet_sections = []
-    for i, line in enumerate(lines):
-        if line.strip() == "## Python Architecture Diagram Snippet":
-            snippet_sections.append(i)
+    # Find all "## Python Architecture Diagram Snippet" sections by scanning
+    # the whole text once, instead of holding it as a list of lines
+    snippet_count = len(_SNIPPET_HEADING_RE.findall(text))
     
-    print(f"Found {len(snippet_sections)} Python Architecture Diagram Snippet sections")
+    print(f"Found {snippet_count} Python Architecture Diagram Snippet sections")
     
-    # Process each section (in reverse to preserve line numbers)
+    # Process the empty ones in order, copying the text between them over in
+    # slices; a line number is only counted for the sections found
     modifications = []
-    for section_line_num in reversed(snippet_sections):
-        # Check if next line is empty (indicating missing code)
-        if section_line_num + 1 < len(lines) and lines[section_line_num + 1].strip() == '':
-            # Find the pattern name
-            pattern_header = find_pattern_name_before_line(lines, section_line_num)
-            if not pattern_header:
-                print(f"Warning: Could not find pattern name for section at line {section_line_num + 1}")
-                continue
-            
-            pattern_name = pattern_name_to_filename(pattern_header)
-            if not pattern_name:
-                print(f"Warning: Could not parse pattern name from: {pattern_header.strip()}")
-                continue
-            
-            python_file = diagrams_dir / f"{pattern_name}.py"
-            
-            if not python_file.exists():
-                print(f"Warning: Python file not found: {python_file}")
-                continue
-            
-            # Read the Python code
-            with open(python_file, 'r', encoding='utf-8') as f:
-                python_code = f.read()
-            
-            # Insert the Python code after the section header
-            # Format: blank line, code block with python tag, blank line
-            insert_text = f"\n```python\n{python_code}```\n\n"
-            
-            modifications.append({
-                'line_num': section_line_num + 1,
-                'pattern': pattern_header.strip(),
-                'filename': pattern_name,
-                'code_length': len(python_code)
-            })
-            
-            # Insert the code
-            lines[section_line_num + 1] = insert_text
+    parts = []
+    pos = counted = line_num = 0
+    for match in _EMPTY_SNIPPET_RE.finditer(text):
+        line_num += text.count('\n', counted, match.start())
+        counted = match.start()
+        # Find the pattern name
+        pattern_header = find_pattern_name_before_line(text, match.start())
+        if not pattern_header:
+            print(f"Warning: Could not find pattern name for section at line {line_num + 1}")
+            continue
+        
+        pattern_name = pattern_name_to_filename(pattern_header)
+        if not pattern_name:
+            print(f"Warning: Could not parse pattern name from: {pattern_header.strip()}")
+            continue
+        
+        python_file = diagrams_dir / f"{pattern_name}.py"
+        
+        if not python_file.exists():
+            print(f"Warning: Python file not found: {python_file}")
+            continue
+        
+        # Read the Python code
+        python_code = python_file.read_text(encoding='utf-8')
+        
+        # Insert the Python code after the section header
+        # Format: blank line, code block with python tag, blank line
+        insert_text = f"\n```python\n{python_code}```\n\n"
+        
+        modifications.append({
+            'line_num': line_num + 1,
+            'pattern': pattern_header.strip(),
+            'filename': pattern_name,
+            'code_length': len(python_code)
+        })
+        
+        # Insert the code in place of the blank line
+        parts.append(text[pos:match.start('blank')])
+        parts.append(insert_text)
+        pos = match.end()
+    parts.append(text[pos:])
     
     # Write the modified content
     print(f"\nModified {len(modifications)} sections:")
-    for mod in reversed(modifications):
+    for mod in modifications:
         print(f"  Line {mod['line_num']}: {mod['pattern']} ({mod['filename']}.py, {mod['code_length']} chars)")
     
     output_file = base_dir / 'master_output_updated.md'
     print(f"\nWriting to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.writelines(lines)
+    output_file.write_text(''.join(parts), encoding='utf-8')
     
     print(f"\n✓ Done! Review {output_file} and replace master_output.md if correct.")
     print(f"\nTo replace:")
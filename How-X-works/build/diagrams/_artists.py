@@ -0,0 +1,16 @@
+# ./build/diagrams/_artists.py
+"""Artist constructors shared by the diagram scripts.
+
+The rounded box styles are built once here and passed to every patch, so
+matplotlib does not parse a "round,pad=..." string for each box.
+"""
+from matplotlib.patches import BoxStyle, FancyBboxPatch
+
+ROUND = BoxStyle('Round', pad=0.1)
+ROUND_TIGHT = BoxStyle('Round', pad=0.05)
+
+
+def rbox(xy, w, h, ec, fc, lw=2, ls='solid', boxstyle=ROUND):
+    """Return a rounded FancyBboxPatch with its lower left corner at xy."""
+    return FancyBboxPatch(xy, w, h, boxstyle=boxstyle, edgecolor=ec,
+                          facecolor=fc, linewidth=lw, linestyle=ls)
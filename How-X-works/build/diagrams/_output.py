@@ -0,0 +1,88 @@
+# ./build/diagrams/_output.py
+"""Helpers shared by the diagram scripts for writing their PNG output.
+
+A rendered PNG is considered fresh when a `<png>.hash` sidecar next to it
+holds the SHA-256 of the generating script, the shared `_*.py` helper
+modules beside it, the matplotlib version and the backend; scripts call `is_fresh` before drawing and `mark_fresh` after saving.
+`new_canvas` attaches the canvas named by $DIAGRAM_BACKEND (default Agg,
+e.g. `module://mplcairo.base` for mplcairo) and `save_png` writes it,
+handing compression to oxipng when present.
+"""
+import glob
+import hashlib
+import importlib
+import os
+import shutil
+import subprocess
+
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+
+# Shared helper modules (_artists.py, _output.py, ...) that every script
+# draws through; editing one must invalidate every PNG
+_HELPERS = sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), '_*.py')))
+
+
+def _backend():
+    """Return the backend named by $DIAGRAM_BACKEND, default Agg."""
+    return os.environ.get('DIAGRAM_BACKEND', 'agg')
+
+
+def source_hash(script):
+    """Return the cache key for the diagram generated by script."""
+    h = hashlib.sha256()
+    for name in [script, *_HELPERS]:
+        with open(name, 'rb') as f:
+            h.update(f.read())
+    h.update(matplotlib.__version__.encode())
+    h.update(_backend().lower().encode())
+    return h.hexdigest()
+
+
+def is_fresh(path, script):
+    """True if path exists and was rendered by the current script source."""
+    try:
+        with open(path + '.hash') as f:
+            recorded = f.read().strip()
+    except OSError:
+        return False
+    return os.path.exists(path) and recorded == source_hash(script)
+
+
+def mark_fresh(path, script):
+    """Record that path was rendered by the current script source."""
+    with open(path + '.hash', 'w') as f:
+        f.write(source_hash(script) + '\n')
+
+
+def new_canvas(fig):
+    """Attach a canvas for the $DIAGRAM_BACKEND backend to fig."""
+    backend = _backend()
+    if backend.lower() == 'agg':
+        return FigureCanvasAgg(fig)
+    if backend.startswith('module://'):
+        module = backend[len('module://'):]
+    else:
+        module = 'matplotlib.backends.backend_' + backend.lower()
+    return importlib.import_module(module).FigureCanvas(fig)
+
+
+def save_png(canvas, path):
+    """Write canvas to path as PNG.
+
+    With oxipng on PATH the canvas is written uncompressed and oxipng
+    (multithreaded) compresses it in place; otherwise Pillow's zlib
+    encoder runs at a low compression level. Non-Agg canvases use their
+    backend's own PNG writer.
+    """
+    oxipng = shutil.which('oxipng')
+    if isinstance(canvas, FigureCanvasAgg):
+        level = 0 if oxipng else 3
+        canvas.print_png(path, pil_kwargs={'compress_level': level, 'optimize': False})
+    else:
+        # Other backends bring their own PNG writer and may not take pil_kwargs
+        canvas.print_figure(path, format='png')
+    if oxipng is not None:
+        subprocess.run([oxipng, '--quiet', '-o', '2', '--strip', 'safe', path],
+                       check=True)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# ./build/diagrams/build_diagrams.py
+"""Render the matplotlib pattern diagrams in parallel, one process per figure.
+
+Run from the How-X-works directory so the docs/images/ output paths
+resolve:
+
+    python3 build/diagrams/build_diagrams.py          # one worker per diagram
+    python3 build/diagrams/build_diagrams.py --jobs 1 # render in-process
+    python3 build/diagrams/build_diagrams.py --force  # ignore .hash sidecars
+
+The diagram modules are imported here, before the pool starts, so
+matplotlib is loaded once and forked workers inherit it instead of each
+script paying the import again.
+
+Set DIAGRAM_BACKEND to render with another canvas, e.g.
+DIAGRAM_BACKEND=module://mplcairo.base with mplcairo installed. Without
+matplotlib at all the build is skipped and the committed PNGs are kept.
+"""
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+try:
+    import singleton_pattern
+    import state_pattern
+    import strategy_pattern
+    import template_method_pattern
+    import virtual_dom_diff_patch_pattern
+    import visitor_pattern
+except ModuleNotFoundError as e:
+    if e.name != 'matplotlib':
+        raise
+    print('matplotlib is not installed; keeping the existing diagrams')
+    sys.exit(0)
+
+DIAGRAMS = {module.__name__: module for module in (
+    singleton_pattern,
+    state_pattern,
+    strategy_pattern,
+    template_method_pattern,
+    virtual_dom_diff_patch_pattern,
+    visitor_pattern,
+)}
+
+
+def render(name, force=False):
+    DIAGRAMS[name].render(force=force)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-j', '--jobs', type=int, default=len(DIAGRAMS),
+                        help='worker processes (1 renders in this process)')
+    parser.add_argument('-f', '--force', action='store_true',
+                        help='re-render even when a PNG is up to date')
+    args = parser.parse_args()
+
+    job = partial(render, force=args.force)
+    if args.jobs <= 1:
+        for name in DIAGRAMS:
+            job(name)
+        return
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        list(pool.map(job, DIAGRAMS))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,128 +1,189 @@
 #!/usr/bin/env python3
 # ./build/diagrams/singleton_pattern.py
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch, Circle
-import numpy as np
-
-fig, ax = plt.subplots(1, 1, figsize=(14, 10))
-ax.set_xlim(0, 12)
-ax.set_ylim(0, 10)
-ax.axis('off')
-
-# Title
-ax.text(6, 9.5, 'Singleton Pattern Architecture', 
-        fontsize=18, fontweight='bold', ha='center')
-
-# Singleton Class
-singleton_box = FancyBboxPatch((4, 6.5), 4, 2, 
-                                boxstyle="round,pad=0.1", 
-                                edgecolor='#8b5cf6', 
-                                facecolor='#f3e8ff', 
-                                linewidth=3)
-ax.add_patch(singleton_box)
-ax.text(6, 8.2, 'Singleton Class', fontsize=13, fontweight='bold', ha='center', color='#8b5cf6')
-ax.text(6, 7.85, 'static instance = null', fontsize=9, ha='center', family='monospace', style='italic')
-ax.text(6, 7.5, 'constructor() { ... }', fontsize=9, ha='center', family='monospace')
-ax.text(6, 7.15, 'static getInstance() {', fontsize=9, ha='center', family='monospace')
-ax.text(6, 6.85, '  return instance', fontsize=9, ha='center', family='monospace')
-ax.text(6, 6.55, '}', fontsize=9, ha='center', family='monospace')
-
-# Single Instance (highlighted)
-instance_box = FancyBboxPatch((4.5, 4), 3, 1.5, 
-                               boxstyle="round,pad=0.1", 
-                               edgecolor='#10b981', 
-                               facecolor='#d1fae5', 
-                               linewidth=2.5)
-ax.add_patch(instance_box)
-ax.text(6, 5.2, '⭐ Single Instance', fontsize=12, fontweight='bold', ha='center', color='#059669')
-ax.text(6, 4.8, 'state: { ... }', fontsize=9, ha='center', family='monospace')
-ax.text(6, 4.5, 'method1()', fontsize=9, ha='center', family='monospace')
-ax.text(6, 4.2, 'method2()', fontsize=9, ha='center', family='monospace')
-
-# Multiple Clients
-client_positions = [
-    (0.5, 2.5, 'Client A'),
-    (3.5, 2.5, 'Client B'),
-    (6.5, 2.5, 'Client C'),
-    (9.5, 2.5, 'Client D')
-]
-
-for x, y, label in client_positions:
-    client_box = FancyBboxPatch((x, y), 1.8, 1, 
-                                 boxstyle="round,pad=0.1", 
-                                 edgecolor='#0ea5e9', 
-                                 facecolor='#e0f2fe', 
-                                 linewidth=1.5)
-    ax.add_patch(client_box)
-    ax.text(x + 0.9, y + 0.7, label, fontsize=10, fontweight='bold', ha='center')
-    ax.text(x + 0.9, y + 0.3, 'getInstance()', fontsize=7, ha='center', family='monospace')
-
-# Arrows from clients to getInstance
-for x, y, label in client_positions:
-    arrow = FancyArrowPatch((x + 0.9, y + 1), (6, 6.5), 
-                             arrowstyle='->', mutation_scale=15, 
-                             linewidth=1.5, color='#0ea5e9', 
-                             alpha=0.7)
-    ax.add_patch(arrow)
-
-# Arrow from Singleton to Instance
-arrow_create = FancyArrowPatch((6, 6.5), (6, 5.5), 
-                                arrowstyle='->', mutation_scale=20, 
-                                linewidth=2.5, color='#8b5cf6')
-ax.add_patch(arrow_create)
-ax.text(6.5, 6, 'creates once', fontsize=8, ha='left', 
-        fontweight='bold', color='#8b5cf6', style='italic')
-
-# Return arrows (showing all get same instance)
-for i, (x, y, label) in enumerate(client_positions):
-    arrow_return = FancyArrowPatch((6, 4), (x + 0.9, y + 1), 
-                                    arrowstyle='->', mutation_scale=12, 
-                                    linewidth=1.5, color='#10b981', 
-                                    linestyle='dashed', alpha=0.6)
-    ax.add_patch(arrow_return)
-
-ax.text(6, 3.5, 'All clients get same instance', 
-        fontsize=9, ha='center', fontweight='bold', 
-        style='italic', color='#059669')
-
-# Key principle box
-principle_box = FancyBboxPatch((0.5, 0.5), 11, 1.5, 
-                                boxstyle="round,pad=0.1", 
-                                edgecolor='#f59e0b', 
-                                facecolor='#fef3c7', 
-                                linewidth=2, alpha=0.8)
-ax.add_patch(principle_box)
-ax.text(6, 1.7, 'Key Principle: Single Instance Shared Globally', 
-        fontsize=11, fontweight='bold', ha='center', color='#f59e0b')
-ax.text(6, 1.35, '✓ Only ONE instance created  •  ✓ Global access point  •  ✓ Lazy initialization', 
-        fontsize=9, ha='center')
-ax.text(6, 1, '✓ Controlled access  •  ✓ State consistency  •  ✓ Resource management', 
-        fontsize=9, ha='center')
-ax.text(6, 0.65, 'Pattern: if (!instance) { instance = new Singleton(); } return instance;', 
-        fontsize=8, ha='center', family='monospace', style='italic', color='#92400e')
-
-# Flow annotation
-ax.text(2, 5, '1. Request', fontsize=8, ha='center', 
-        bbox=dict(boxstyle='round,pad=0.3', facecolor='#dbeafe', alpha=0.9))
-ax.text(9, 5, '2. Return', fontsize=8, ha='center', 
-        bbox=dict(boxstyle='round,pad=0.3', facecolor='#d1fae5', alpha=0.9))
-
-# Warning annotation
-ax.text(10.5, 8, '⚠️ Caution:', fontsize=9, fontweight='bold', ha='center', color='#dc2626')
-ax.text(10.5, 7.6, 'Global state', fontsize=7, ha='center', color='#dc2626')
-ax.text(10.5, 7.3, 'Testing challenges', fontsize=7, ha='center', color='#dc2626')
-ax.text(10.5, 7, 'Hidden dependencies', fontsize=7, ha='center', color='#dc2626')
-
-# Legend
-legend_elements = [
-    mpatches.Patch(facecolor='#f3e8ff', edgecolor='#8b5cf6', label='Singleton Class'),
-    mpatches.Patch(facecolor='#d1fae5', edgecolor='#10b981', label='Single Instance'),
-    mpatches.Patch(facecolor='#e0f2fe', edgecolor='#0ea5e9', label='Clients'),
-]
-ax.legend(handles=legend_elements, loc='upper left', fontsize=9)
-
-plt.tight_layout()
-plt.savefig('docs/images/singleton_pattern.png', dpi=300, bbox_inches='tight')
-print("Singleton Pattern diagram saved to docs/images/singleton_pattern.png")
+import math
 
+import matplotlib as mpl
+from matplotlib.figure import Figure
+import matplotlib.patches as mpatches
+from matplotlib.patches import ArrowStyle, FancyBboxPatch, FancyArrowPatch
+from matplotlib.collections import PatchCollection, LineCollection
+from matplotlib.font_manager import FontProperties
+
+from _output import is_fresh, mark_fresh, new_canvas, save_png
+
+# Let Agg drop sub-pixel path vertices and split long paths into chunks
+mpl.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+})
+
+OUTPUT = 'docs/images/singleton_pattern.png'
+
+# Shared font properties, resolved once instead of per ax.text call
+MONO7 = FontProperties(family='monospace', size=7)
+MONO8 = FontProperties(family='monospace', size=8)
+MONO9 = FontProperties(family='monospace', size=9)
+
+# Arrow styles, parsed once instead of per FancyArrowPatch
+ARROW = ArrowStyle('->')
+
+
+def arrow_barbs(segments, length=0.1, spread=0.46):
+    """Return the two barbs of an open '->' head for each (start, end) segment."""
+    barbs = []
+    for (x0, y0), (x1, y1) in segments:
+        angle = math.atan2(y1 - y0, x1 - x0)
+        for side in (spread, -spread):
+            barbs.append([(x1 - length * math.cos(angle + side),
+                           y1 - length * math.sin(angle + side)), (x1, y1)])
+    return barbs
+
+
+def render(path=OUTPUT, force=False):
+    """Draw the Singleton Pattern diagram and save it to path.
+
+    Skips the render when path is already up to date with this script,
+    unless force is set.
+    """
+    if not force and is_fresh(path, __file__):
+        print(f"Singleton Pattern diagram up to date: {path}")
+        return
+
+    # Build the figure on a canvas directly (Agg unless $DIAGRAM_BACKEND says
+    # otherwise); nothing here needs pyplot's global figure registry
+    fig = Figure(figsize=(14, 10), dpi=300)
+    canvas = new_canvas(fig)
+    ax = fig.add_subplot(1, 1, 1)
+    ax.set_xlim(0, 12)
+    ax.set_ylim(0, 10)
+    ax.axis('off')
+    # Fixed margins instead of tight_layout/bbox_inches='tight', which cost
+    # an extra full draw to measure the ink extents
+    fig.subplots_adjust(left=0.01, right=0.99, bottom=0.01, top=0.99)
+
+    # Labels are static, so place them on the figure through one frozen
+    # data -> figure-fraction affine rather than the axes transform stack
+    to_fig = (ax.transData + fig.transFigure.inverted()).frozen()
+
+    def text(x, y, s, **kwargs):
+        return fig.text(*to_fig.transform((x, y)), s, **kwargs)
+
+    # Title
+    text(6, 9.5, 'Singleton Pattern Architecture', 
+         fontsize=18, fontweight='bold', ha='center')
+
+    # Singleton Class
+    singleton_box = FancyBboxPatch((4, 6.5), 4, 2, 
+                                    boxstyle="round,pad=0.1", 
+                                    edgecolor='#8b5cf6', 
+                                    facecolor='#f3e8ff', 
+                                    linewidth=3)
+    text(6, 8.2, 'Singleton Class', fontsize=13, fontweight='bold', ha='center', color='#8b5cf6')
+    text(6, 7.85, 'static instance = null', ha='center', fontproperties=MONO9, style='italic')
+    text(6, 7.5, 'constructor() { ... }', ha='center', fontproperties=MONO9)
+    text(6, 7.15, 'static getInstance() {', ha='center', fontproperties=MONO9)
+    text(6, 6.85, '  return instance', ha='center', fontproperties=MONO9)
+    text(6, 6.55, '}', ha='center', fontproperties=MONO9)
+
+    # Single Instance (highlighted)
+    instance_box = FancyBboxPatch((4.5, 4), 3, 1.5, 
+                                   boxstyle="round,pad=0.1", 
+                                   edgecolor='#10b981', 
+                                   facecolor='#d1fae5', 
+                                   linewidth=2.5)
+    text(6, 5.2, '⭐ Single Instance', fontsize=12, fontweight='bold', ha='center', color='#059669')
+    text(6, 4.8, 'state: { ... }', ha='center', fontproperties=MONO9)
+    text(6, 4.5, 'method1()', ha='center', fontproperties=MONO9)
+    text(6, 4.2, 'method2()', ha='center', fontproperties=MONO9)
+
+    # Multiple Clients
+    client_positions = [
+        (0.5, 2.5, 'Client A'),
+        (3.5, 2.5, 'Client B'),
+        (6.5, 2.5, 'Client C'),
+        (9.5, 2.5, 'Client D')
+    ]
+
+    # All client boxes share one style, so draw them as a single collection
+    client_boxes = PatchCollection([FancyBboxPatch((x, y), 1.8, 1, boxstyle="round,pad=0.1")
+                                    for x, y, _ in client_positions],
+                                   edgecolors='#0ea5e9', facecolors='#e0f2fe',
+                                   linewidths=1.5, zorder=0.5)
+    ax.add_collection(client_boxes)
+
+    for x, y, label in client_positions:
+        text(x + 0.9, y + 0.7, label, fontsize=10, fontweight='bold', ha='center')
+        text(x + 0.9, y + 0.3, 'getInstance()', ha='center', fontproperties=MONO7)
+
+    # Arrows from clients to getInstance (shafts and heads in one collection)
+    segs_in = [[(x + 0.9, y + 1), (6, 6.5)] for x, y, _ in client_positions]
+    ax.add_collection(LineCollection(segs_in + arrow_barbs(segs_in),
+                                     colors='#0ea5e9', linewidths=1.5, alpha=0.7))
+
+    # Arrow from Singleton to Instance
+    arrow_create = FancyArrowPatch((6, 6.5), (6, 5.5), 
+                                    arrowstyle=ARROW, mutation_scale=20, 
+                                    linewidth=2.5, color='#8b5cf6')
+    ax.add_patch(arrow_create)
+    text(6.5, 6, 'creates once', fontsize=8, ha='left', 
+         fontweight='bold', color='#8b5cf6', style='italic')
+
+    # Return arrows (showing all get same instance)
+    segs_out = [[(6, 4), (x + 0.9, y + 1)] for x, y, _ in client_positions]
+    ax.add_collection(LineCollection(segs_out + arrow_barbs(segs_out, length=0.08),
+                                     colors='#10b981', linewidths=1.5,
+                                     linestyles='dashed', alpha=0.6))
+
+    text(6, 3.5, 'All clients get same instance', 
+         fontsize=9, ha='center', fontweight='bold', 
+         style='italic', color='#059669')
+
+    # Key principle box; nothing sits behind it, so its former alpha=0.8 is
+    # baked into opaque colours (#f59e0b / #fef3c7 over white) and Agg can
+    # skip blending it
+    principle_box = FancyBboxPatch((0.5, 0.5), 11, 1.5, 
+                                    boxstyle="round,pad=0.1", 
+                                    edgecolor='#f7b13c', 
+                                    facecolor='#fef5d2', 
+                                    linewidth=2)
+
+    # Singleton, instance and principle boxes keep their own colours; zorder
+    # keeps them underneath the arrows drawn above
+    ax.add_collection(PatchCollection([singleton_box, instance_box, principle_box],
+                                      match_original=True, zorder=0.5))
+    text(6, 1.7, 'Key Principle: Single Instance Shared Globally', 
+         fontsize=11, fontweight='bold', ha='center', color='#f59e0b')
+    text(6, 1.35, '✓ Only ONE instance created  •  ✓ Global access point  •  ✓ Lazy initialization', 
+         fontsize=9, ha='center')
+    text(6, 1, '✓ Controlled access  •  ✓ State consistency  •  ✓ Resource management', 
+         fontsize=9, ha='center')
+    text(6, 0.65, 'Pattern: if (!instance) { instance = new Singleton(); } return instance;', 
+         ha='center', fontproperties=MONO8, style='italic', color='#92400e')
+
+    # Flow annotation
+    text(2, 5, '1. Request', fontsize=8, ha='center', 
+         bbox=dict(boxstyle='round,pad=0.3', facecolor='#dbeafe', alpha=0.9))
+    text(9, 5, '2. Return', fontsize=8, ha='center', 
+         bbox=dict(boxstyle='round,pad=0.3', facecolor='#d1fae5', alpha=0.9))
+
+    # Warning annotation
+    text(10.5, 8, '⚠️ Caution:', fontsize=9, fontweight='bold', ha='center', color='#dc2626')
+    text(10.5, 7, 'Global state\nTesting challenges\nHidden dependencies',
+         fontsize=7, ha='center', color='#dc2626', linespacing=2.99)
+
+    # Legend
+    legend_elements = [
+        mpatches.Patch(facecolor='#f3e8ff', edgecolor='#8b5cf6', label='Singleton Class'),
+        mpatches.Patch(facecolor='#d1fae5', edgecolor='#10b981', label='Single Instance'),
+        mpatches.Patch(facecolor='#e0f2fe', edgecolor='#0ea5e9', label='Clients'),
+    ]
+    ax.legend(handles=legend_elements, loc='upper left', fontsize=9)
+
+    save_png(canvas, path)
+    mark_fresh(path, __file__)
+    print(f"Singleton Pattern diagram saved to {path}")
+
+
+if __name__ == '__main__':
+    render()
@@ -1,221 +1,270 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch, Circle
-import numpy as np
-
-# Create figure and axis
-fig, ax = plt.subplots(1, 1, figsize=(14, 10))
-ax.set_xlim(0, 14)
-ax.set_ylim(0, 10)
-ax.axis('off')
-
-# Title
-ax.text(7, 9.5, 'State Pattern Architecture', 
-        fontsize=20, weight='bold', ha='center')
-ax.text(7, 9.0, 'Object behavior changes when internal state changes (appears to change class)',
-        fontsize=11, ha='center', style='italic', color='#555')
-
-# Color scheme
-color_context = '#FFE5CC'
-color_state = '#E8F4F8'
-color_concrete = '#B8E6F0'
-
-# ===== CONTEXT =====
-context_box = FancyBboxPatch((0.5, 6.0), 2.8, 2.0,
-                            boxstyle="round,pad=0.1", 
-                            edgecolor='#E63946', facecolor=color_context,
-                            linewidth=2.5)
-ax.add_patch(context_box)
-ax.text(1.9, 7.7, 'Context', fontsize=12, ha='center', weight='bold')
-ax.text(1.9, 7.4, '(Document/Connection)', fontsize=9, ha='center', style='italic', color='#666')
-ax.text(1.9, 7.05, 'state: State', fontsize=9, ha='center', family='monospace', color='#555')
-ax.text(1.9, 6.75, 'setState(state)', fontsize=10, ha='center', family='monospace')
-ax.text(1.9, 6.45, 'request()', fontsize=10, ha='center', family='monospace')
-ax.text(1.9, 6.15, '→ state.handle()', fontsize=9, ha='center', style='italic', color='#E63946')
-
-# ===== STATE INTERFACE =====
-state_interface = FancyBboxPatch((5.5, 6.5), 3.0, 1.5,
+import math
+
+import matplotlib as mpl
+from matplotlib.figure import Figure
+from matplotlib.patches import ArrowStyle, FancyBboxPatch, FancyArrowPatch
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.font_manager import FontProperties
+
+from _output import is_fresh, mark_fresh, new_canvas, save_png
+
+# Let Agg drop sub-pixel path vertices and split long paths into chunks
+mpl.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+})
+
+OUTPUT = 'docs/images/state_pattern.png'
+
+# Shared font properties, resolved once instead of per ax.text call
+MONO9 = FontProperties(family='monospace', size=9)
+MONO10 = FontProperties(family='monospace', size=10)
+
+# Arrow styles, parsed once instead of per FancyArrowPatch
+ARROW = ArrowStyle('->')
+
+
+def arrow_head(start, end, length=0.09, width=0.045):
+    """Return the (left, tip, right) corners of an arrowhead pointing at end."""
+    (x0, y0), (x1, y1) = start, end
+    dist = math.hypot(x1 - x0, y1 - y0)
+    ux, uy = (x1 - x0) / dist, (y1 - y0) / dist
+    bx, by = x1 - ux * length, y1 - uy * length
+    return [(bx - uy * width, by + ux * width), (x1, y1), (bx + uy * width, by - ux * width)]
+
+
+def render(path=OUTPUT, force=False):
+    """Draw the State Pattern diagram and save it to path.
+
+    Skips the render when path is already up to date with this script,
+    unless force is set.
+    """
+    if not force and is_fresh(path, __file__):
+        print(f"State Pattern diagram up to date: {path}")
+        return
+
+    # Create figure and axis
+    # Build the figure on a canvas directly (Agg unless $DIAGRAM_BACKEND says
+    # otherwise); nothing here needs pyplot's global figure registry
+    fig = Figure(figsize=(14, 10), dpi=300)
+    canvas = new_canvas(fig)
+    ax = fig.add_subplot(1, 1, 1)
+    ax.set_xlim(0, 14)
+    ax.set_ylim(0, 10)
+    ax.axis('off')
+    # Fixed margins instead of tight_layout/bbox_inches='tight', which cost
+    # an extra full draw to measure the ink extents
+    fig.subplots_adjust(left=0.01, right=0.99, bottom=0.01, top=0.99)
+
+    # Labels are static, so place them on the figure through one frozen
+    # data -> figure-fraction affine rather than the axes transform stack
+    to_fig = (ax.transData + fig.transFigure.inverted()).frozen()
+
+    def text(x, y, s, **kwargs):
+        return fig.text(*to_fig.transform((x, y)), s, **kwargs)
+
+    # Title
+    text(7, 9.5, 'State Pattern Architecture', 
+         fontsize=20, weight='bold', ha='center')
+    text(7, 9.0, 'Object behavior changes when internal state changes (appears to change class)',
+         fontsize=11, ha='center', style='italic', color='#555')
+
+    # Color scheme
+    color_context = '#FFE5CC'
+    color_state = '#E8F4F8'
+    color_concrete = '#B8E6F0'
+
+    # ===== CONTEXT =====
+    context_box = FancyBboxPatch((0.5, 6.0), 2.8, 2.0,
                                 boxstyle="round,pad=0.1", 
-                                edgecolor='#2E86AB', facecolor=color_state,
-                                linewidth=2, linestyle='--')
-ax.add_patch(state_interface)
-ax.text(7.0, 7.75, '«interface»', fontsize=9, ha='center', style='italic', color='#2E86AB')
-ax.text(7.0, 7.5, 'State', fontsize=12, ha='center', weight='bold')
-ax.text(7.0, 7.15, 'handle(context)', fontsize=10, ha='center', family='monospace')
-ax.text(7.0, 6.85, 'State-specific behavior', fontsize=8, ha='center', style='italic', color='#555')
-
-# ===== CONCRETE STATE A =====
-stateA = FancyBboxPatch((10.0, 6.5), 2.2, 1.5,
-                       boxstyle="round,pad=0.1", 
-                       edgecolor='#2E86AB', facecolor=color_concrete,
-                       linewidth=2)
-ax.add_patch(stateA)
-ax.text(11.1, 7.75, 'StateA', fontsize=11, ha='center', weight='bold')
-ax.text(11.1, 7.5, '(DraftState)', fontsize=8, ha='center', style='italic', color='#666')
-ax.text(11.1, 7.2, 'handle()', fontsize=9, ha='center', family='monospace')
-ax.text(11.1, 6.9, '→ setState(B)', fontsize=8, ha='center', style='italic', color='#2E86AB')
-
-# ===== CONCRETE STATE B =====
-stateB = FancyBboxPatch((10.0, 4.5), 2.2, 1.5,
-                       boxstyle="round,pad=0.1", 
-                       edgecolor='#2E86AB', facecolor=color_concrete,
-                       linewidth=2)
-ax.add_patch(stateB)
-ax.text(11.1, 5.75, 'StateB', fontsize=11, ha='center', weight='bold')
-ax.text(11.1, 5.5, '(ReviewState)', fontsize=8, ha='center', style='italic', color='#666')
-ax.text(11.1, 5.2, 'handle()', fontsize=9, ha='center', family='monospace')
-ax.text(11.1, 4.9, '→ setState(C)', fontsize=8, ha='center', style='italic', color='#2E86AB')
-
-# ===== CONCRETE STATE C =====
-stateC = FancyBboxPatch((10.0, 2.5), 2.2, 1.5,
-                       boxstyle="round,pad=0.1", 
-                       edgecolor='#2E86AB', facecolor=color_concrete,
-                       linewidth=2)
-ax.add_patch(stateC)
-ax.text(11.1, 3.75, 'StateC', fontsize=11, ha='center', weight='bold')
-ax.text(11.1, 3.5, '(PublishedState)', fontsize=8, ha='center', style='italic', color='#666')
-ax.text(11.1, 3.2, 'handle()', fontsize=9, ha='center', family='monospace')
-ax.text(11.1, 2.9, 'Final state', fontsize=8, ha='center', style='italic', color='#555')
-
-# ===== RELATIONSHIPS =====
-
-# Context holds State
-arrow1 = FancyArrowPatch((3.3, 7.0), (5.5, 7.0),
-                        arrowstyle='->', mutation_scale=20, 
-                        color='#E63946', linewidth=2)
-ax.add_patch(arrow1)
-ax.text(4.4, 7.3, 'holds', fontsize=9, style='italic', color='#E63946')
-
-# Context delegates to State
-arrow_delegate = FancyArrowPatch((3.3, 6.5), (5.5, 6.8),
-                               arrowstyle='->', mutation_scale=15, 
-                               color='#999', linewidth=1.5, linestyle='dotted')
-ax.add_patch(arrow_delegate)
-ax.text(4.4, 6.3, 'delegates', fontsize=8, style='italic', color='#999')
-
-# States implement interface
-arrow2 = FancyArrowPatch((10.0, 7.2), (8.5, 7.2),
-                        arrowstyle='-|>', mutation_scale=15, 
-                        color='#2E86AB', linewidth=1.5, linestyle='dashed')
-ax.add_patch(arrow2)
-ax.text(9.2, 7.5, 'implements', fontsize=8, style='italic', color='#2E86AB')
-
-arrow3 = FancyArrowPatch((10.0, 5.2), (8.5, 6.8),
-                        arrowstyle='-|>', mutation_scale=15, 
-                        color='#2E86AB', linewidth=1.5, linestyle='dashed')
-ax.add_patch(arrow3)
-
-arrow4 = FancyArrowPatch((10.0, 3.2), (8.5, 6.5),
-                        arrowstyle='-|>', mutation_scale=15, 
-                        color='#2E86AB', linewidth=1.5, linestyle='dashed')
-ax.add_patch(arrow4)
-
-# State transitions
-trans1 = FancyArrowPatch((11.1, 6.5), (11.1, 6.0),
-                        arrowstyle='->', mutation_scale=15, 
-                        color='#52B788', linewidth=2)
-ax.add_patch(trans1)
-ax.text(11.6, 6.25, 'transition', fontsize=8, style='italic', color='#52B788')
-
-trans2 = FancyArrowPatch((11.1, 4.5), (11.1, 4.0),
-                        arrowstyle='->', mutation_scale=15, 
-                        color='#52B788', linewidth=2)
-ax.add_patch(trans2)
-ax.text(11.6, 4.25, 'transition', fontsize=8, style='italic', color='#52B788')
-
-# ===== STATE MACHINE DIAGRAM =====
-sm_y = 5.0
-ax.text(2.5, sm_y + 0.3, 'State Machine', fontsize=11, ha='center', weight='bold', color='#9D4EDD')
-
-# Draw states as circles
-states_pos = {
-    'Draft': (1.0, sm_y - 0.8),
-    'Review': (2.5, sm_y - 0.8),
-    'Published': (4.0, sm_y - 0.8)
-}
-
-for state, (x, y) in states_pos.items():
-    circle = Circle((x, y), 0.35, facecolor='#F3E5F5', edgecolor='#9D4EDD', linewidth=2)
-    ax.add_patch(circle)
-    ax.text(x, y, state, fontsize=8, ha='center', va='center', weight='bold')
-
-# Transitions
-trans_draft_review = FancyArrowPatch((1.35, sm_y - 0.8), (2.15, sm_y - 0.8),
-                                    arrowstyle='->', mutation_scale=12, 
-                                    color='#9D4EDD', linewidth=1.5)
-ax.add_patch(trans_draft_review)
-ax.text(1.75, sm_y - 0.55, 'review()', fontsize=7, ha='center', style='italic', color='#9D4EDD')
-
-trans_review_published = FancyArrowPatch((2.85, sm_y - 0.8), (3.65, sm_y - 0.8),
-                                        arrowstyle='->', mutation_scale=12, 
+                                edgecolor='#E63946', facecolor=color_context,
+                                linewidth=2.5)
+    ax.add_patch(context_box)
+    text(1.9, 7.7, 'Context', fontsize=12, ha='center', weight='bold')
+    text(1.9, 7.4, '(Document/Connection)', fontsize=9, ha='center', style='italic', color='#666')
+    text(1.9, 7.05, 'state: State', ha='center', fontproperties=MONO9, color='#555')
+    text(1.9, 6.75, 'setState(state)', ha='center', fontproperties=MONO10)
+    text(1.9, 6.45, 'request()', ha='center', fontproperties=MONO10)
+    text(1.9, 6.15, '→ state.handle()', fontsize=9, ha='center', style='italic', color='#E63946')
+
+    # ===== STATE INTERFACE =====
+    state_interface = FancyBboxPatch((5.5, 6.5), 3.0, 1.5,
+                                    boxstyle="round,pad=0.1", 
+                                    edgecolor='#2E86AB', facecolor=color_state,
+                                    linewidth=2, linestyle='--')
+    ax.add_patch(state_interface)
+    text(7.0, 7.75, '«interface»', fontsize=9, ha='center', style='italic', color='#2E86AB')
+    text(7.0, 7.5, 'State', fontsize=12, ha='center', weight='bold')
+    text(7.0, 7.15, 'handle(context)', ha='center', fontproperties=MONO10)
+    text(7.0, 6.85, 'State-specific behavior', fontsize=8, ha='center', style='italic', color='#555')
+
+    # ===== CONCRETE STATE A =====
+    stateA = FancyBboxPatch((10.0, 6.5), 2.2, 1.5,
+                           boxstyle="round,pad=0.1", 
+                           edgecolor='#2E86AB', facecolor=color_concrete,
+                           linewidth=2)
+    ax.add_patch(stateA)
+    text(11.1, 7.75, 'StateA', fontsize=11, ha='center', weight='bold')
+    text(11.1, 7.5, '(DraftState)', fontsize=8, ha='center', style='italic', color='#666')
+    text(11.1, 7.2, 'handle()', ha='center', fontproperties=MONO9)
+    text(11.1, 6.9, '→ setState(B)', fontsize=8, ha='center', style='italic', color='#2E86AB')
+
+    # ===== CONCRETE STATE B =====
+    stateB = FancyBboxPatch((10.0, 4.5), 2.2, 1.5,
+                           boxstyle="round,pad=0.1", 
+                           edgecolor='#2E86AB', facecolor=color_concrete,
+                           linewidth=2)
+    ax.add_patch(stateB)
+    text(11.1, 5.75, 'StateB', fontsize=11, ha='center', weight='bold')
+    text(11.1, 5.5, '(ReviewState)', fontsize=8, ha='center', style='italic', color='#666')
+    text(11.1, 5.2, 'handle()', ha='center', fontproperties=MONO9)
+    text(11.1, 4.9, '→ setState(C)', fontsize=8, ha='center', style='italic', color='#2E86AB')
+
+    # ===== CONCRETE STATE C =====
+    stateC = FancyBboxPatch((10.0, 2.5), 2.2, 1.5,
+                           boxstyle="round,pad=0.1", 
+                           edgecolor='#2E86AB', facecolor=color_concrete,
+                           linewidth=2)
+    ax.add_patch(stateC)
+    text(11.1, 3.75, 'StateC', fontsize=11, ha='center', weight='bold')
+    text(11.1, 3.5, '(PublishedState)', fontsize=8, ha='center', style='italic', color='#666')
+    text(11.1, 3.2, 'handle()', ha='center', fontproperties=MONO9)
+    text(11.1, 2.9, 'Final state', fontsize=8, ha='center', style='italic', color='#555')
+
+    # ===== RELATIONSHIPS =====
+
+    # Context holds State
+    arrow1 = FancyArrowPatch((3.3, 7.0), (5.5, 7.0),
+                            arrowstyle=ARROW, mutation_scale=20, 
+                            color='#E63946', linewidth=2)
+    ax.add_patch(arrow1)
+    text(4.4, 7.3, 'holds', fontsize=9, style='italic', color='#E63946')
+
+    # Context delegates to State
+    arrow_delegate = FancyArrowPatch((3.3, 6.5), (5.5, 6.8),
+                                   arrowstyle=ARROW, mutation_scale=15, 
+                                   color='#999', linewidth=1.5, linestyle='dotted')
+    ax.add_patch(arrow_delegate)
+    text(4.4, 6.3, 'delegates', fontsize=8, style='italic', color='#999')
+
+    # States implement interface: dashed shafts plus filled '-|>' heads
+    impl_segs = [((10.0, 7.2), (8.5, 7.2)),
+                 ((10.0, 5.2), (8.5, 6.8)),
+                 ((10.0, 3.2), (8.5, 6.5))]
+    ax.add_collection(LineCollection(impl_segs, colors='#2E86AB', linewidths=1.5,
+                                     linestyles='dashed'))
+    ax.add_collection(PolyCollection([arrow_head(a, b) for a, b in impl_segs],
+                                     facecolors='#2E86AB', edgecolors='#2E86AB',
+                                     linewidths=1.5))
+    text(9.2, 7.5, 'implements', fontsize=8, style='italic', color='#2E86AB')
+
+    # State transitions: shafts and open '->' heads in one collection
+    trans_segs = [((11.1, 6.5), (11.1, 6.0)),
+                  ((11.1, 4.5), (11.1, 4.0))]
+    ax.add_collection(LineCollection(trans_segs + [arrow_head(a, b) for a, b in trans_segs],
+                                     colors='#52B788', linewidths=2))
+    text(11.6, 6.25, 'transition', fontsize=8, style='italic', color='#52B788')
+    text(11.6, 4.25, 'transition', fontsize=8, style='italic', color='#52B788')
+
+    # ===== STATE MACHINE DIAGRAM =====
+    sm_y = 5.0
+    text(2.5, sm_y + 0.3, 'State Machine', fontsize=11, ha='center', weight='bold', color='#9D4EDD')
+
+    # Draw states as circles
+    states_pos = {
+        'Draft': (1.0, sm_y - 0.8),
+        'Review': (2.5, sm_y - 0.8),
+        'Published': (4.0, sm_y - 0.8)
+    }
+
+    # One scatter call for all three nodes; marker size is the diameter in
+    # points squared, so convert the 0.35 data-unit radius via transData
+    radius_pts = (ax.transData.transform((0.35, 0))[0]
+                  - ax.transData.transform((0, 0))[0]) * 72 / fig.dpi
+    xs, ys = zip(*states_pos.values())
+    ax.scatter(xs, ys, s=(2 * radius_pts) ** 2, facecolors='#F3E5F5',
+               edgecolors='#9D4EDD', linewidths=2)
+    for state, (x, y) in states_pos.items():
+        text(x, y, state, fontsize=8, ha='center', va='center', weight='bold')
+
+    # Transitions
+    trans_draft_review = FancyArrowPatch((1.35, sm_y - 0.8), (2.15, sm_y - 0.8),
+                                        arrowstyle=ARROW, mutation_scale=12, 
                                         color='#9D4EDD', linewidth=1.5)
-ax.add_patch(trans_review_published)
-ax.text(3.25, sm_y - 0.55, 'publish()', fontsize=7, ha='center', style='italic', color='#9D4EDD')
-
-# Back transition
-trans_back = FancyArrowPatch((3.65, sm_y - 1.1), (1.35, sm_y - 1.1),
-                            arrowstyle='->', mutation_scale=10, 
-                            color='#999', linewidth=1, linestyle='dashed')
-ax.add_patch(trans_back)
-ax.text(2.5, sm_y - 1.35, 'unpublish()', fontsize=7, ha='center', style='italic', color='#999')
-
-# ===== SEQUENCE DIAGRAM =====
-seq_y = 2.5
-ax.text(2.5, seq_y + 0.5, 'Execution Flow', fontsize=11, ha='center', weight='bold')
-
-seq_box = FancyBboxPatch((0.5, seq_y - 1.2), 4.0, 1.5,
-                        boxstyle="round,pad=0.05", 
-                        edgecolor='#999', facecolor='#F9F9F9',
-                        linewidth=1)
-ax.add_patch(seq_box)
-
-ax.text(0.7, seq_y + 0.1, '1.', fontsize=9, ha='left', weight='bold')
-ax.text(1.0, seq_y + 0.1, 'Client calls context.request()', fontsize=8, ha='left')
-
-ax.text(0.7, seq_y - 0.2, '2.', fontsize=9, ha='left', weight='bold')
-ax.text(1.0, seq_y - 0.2, 'Context delegates to state.handle()', fontsize=8, ha='left')
-
-ax.text(0.7, seq_y - 0.5, '3.', fontsize=9, ha='left', weight='bold')
-ax.text(1.0, seq_y - 0.5, 'State executes behavior', fontsize=8, ha='left')
-
-ax.text(0.7, seq_y - 0.8, '4.', fontsize=9, ha='left', weight='bold')
-ax.text(1.0, seq_y - 0.8, 'State may call context.setState(newState)', fontsize=8, ha='left')
-
-# ===== WITHOUT VS WITH STATE PATTERN =====
-comp_y = 1.0
-
-# Without
-without_box = FancyBboxPatch((5.5, comp_y - 0.5), 3.5, 1.0,
+    ax.add_patch(trans_draft_review)
+    text(1.75, sm_y - 0.55, 'review()', fontsize=7, ha='center', style='italic', color='#9D4EDD')
+
+    trans_review_published = FancyArrowPatch((2.85, sm_y - 0.8), (3.65, sm_y - 0.8),
+                                            arrowstyle=ARROW, mutation_scale=12, 
+                                            color='#9D4EDD', linewidth=1.5)
+    ax.add_patch(trans_review_published)
+    text(3.25, sm_y - 0.55, 'publish()', fontsize=7, ha='center', style='italic', color='#9D4EDD')
+
+    # Back transition
+    trans_back = FancyArrowPatch((3.65, sm_y - 1.1), (1.35, sm_y - 1.1),
+                                arrowstyle=ARROW, mutation_scale=10, 
+                                color='#999', linewidth=1, linestyle='dashed')
+    ax.add_patch(trans_back)
+    text(2.5, sm_y - 1.35, 'unpublish()', fontsize=7, ha='center', style='italic', color='#999')
+
+    # ===== SEQUENCE DIAGRAM =====
+    seq_y = 2.5
+    text(2.5, seq_y + 0.5, 'Execution Flow', fontsize=11, ha='center', weight='bold')
+
+    seq_box = FancyBboxPatch((0.5, seq_y - 1.2), 4.0, 1.5,
                             boxstyle="round,pad=0.05", 
-                            edgecolor='#C41E3A', facecolor='#FFE5E5',
-                            linewidth=1.5)
-ax.add_patch(without_box)
-ax.text(7.25, comp_y + 0.35, '❌ Without State Pattern', fontsize=10, ha='center', weight='bold', color='#C41E3A')
-ax.text(5.7, comp_y + 0.05, '• if/switch statements', fontsize=7, ha='left', color='#C41E3A')
-ax.text(5.7, comp_y - 0.15, '• Scattered state logic', fontsize=7, ha='left', color='#C41E3A')
-ax.text(5.7, comp_y - 0.35, '• Hard to extend', fontsize=7, ha='left', color='#C41E3A')
-
-# With
-with_box = FancyBboxPatch((9.5, comp_y - 0.5), 3.5, 1.0,
-                         boxstyle="round,pad=0.05", 
-                         edgecolor='#2E7D32', facecolor='#E8F5E9',
-                         linewidth=1.5)
-ax.add_patch(with_box)
-ax.text(11.25, comp_y + 0.35, '✓ With State Pattern', fontsize=10, ha='center', weight='bold', color='#2E7D32')
-ax.text(9.7, comp_y + 0.05, '• State objects', fontsize=7, ha='left', color='#2E7D32')
-ax.text(9.7, comp_y - 0.15, '• Encapsulated logic', fontsize=7, ha='left', color='#2E7D32')
-ax.text(9.7, comp_y - 0.35, '• Easy to extend', fontsize=7, ha='left', color='#2E7D32')
-
-# ===== KEY BENEFITS =====
-benefits_box = FancyBboxPatch((5.5, 0.05), 7.5, 0.5,
+                            edgecolor='#999', facecolor='#F9F9F9',
+                            linewidth=1)
+    ax.add_patch(seq_box)
+
+    # One Text artist per column; multi-line text is anchored on the baseline
+    # of its last line, and linespacing keeps the 0.3-unit row pitch
+    text(0.7, seq_y - 0.8, '1.\n2.\n3.\n4.', fontsize=9, ha='left', weight='bold',
+         linespacing=2.32)
+    text(1.0, seq_y - 0.8, '\n'.join([
+        'Client calls context.request()',
+        'Context delegates to state.handle()',
+        'State executes behavior',
+        'State may call context.setState(newState)',
+    ]), fontsize=8, ha='left', linespacing=2.61)
+
+    # ===== WITHOUT VS WITH STATE PATTERN =====
+    comp_y = 1.0
+
+    # Without
+    without_box = FancyBboxPatch((5.5, comp_y - 0.5), 3.5, 1.0,
+                                boxstyle="round,pad=0.05", 
+                                edgecolor='#C41E3A', facecolor='#FFE5E5',
+                                linewidth=1.5)
+    ax.add_patch(without_box)
+    text(7.25, comp_y + 0.35, '❌ Without State Pattern', fontsize=10, ha='center', weight='bold', color='#C41E3A')
+    text(5.7, comp_y - 0.35, '• if/switch statements\n• Scattered state logic\n• Hard to extend',
+         fontsize=7, ha='left', color='#C41E3A', linespacing=1.98)
+
+    # With
+    with_box = FancyBboxPatch((9.5, comp_y - 0.5), 3.5, 1.0,
                              boxstyle="round,pad=0.05", 
-                             edgecolor='#666', facecolor='#FAFAFA',
-                             linewidth=1)
-ax.add_patch(benefits_box)
-ax.text(9.25, 0.4, 'Key Benefits: Eliminate conditionals • Encapsulate state logic • Easy to extend • Clear transitions',
-        fontsize=8, ha='center', style='italic', color='#666')
-
-plt.tight_layout()
-plt.savefig('docs/images/state_pattern.png', dpi=300, bbox_inches='tight', facecolor='white')
-print("✓ State Pattern diagram generated: docs/images/state_pattern.png")
-
+                             edgecolor='#2E7D32', facecolor='#E8F5E9',
+                             linewidth=1.5)
+    ax.add_patch(with_box)
+    text(11.25, comp_y + 0.35, '✓ With State Pattern', fontsize=10, ha='center', weight='bold', color='#2E7D32')
+    text(9.7, comp_y - 0.35, '• State objects\n• Encapsulated logic\n• Easy to extend',
+         fontsize=7, ha='left', color='#2E7D32', linespacing=1.98)
+
+    # ===== KEY BENEFITS =====
+    benefits_box = FancyBboxPatch((5.5, 0.05), 7.5, 0.5,
+                                 boxstyle="round,pad=0.05", 
+                                 edgecolor='#666', facecolor='#FAFAFA',
+                                 linewidth=1)
+    ax.add_patch(benefits_box)
+    text(9.25, 0.4, 'Key Benefits: Eliminate conditionals • Encapsulate state logic • Easy to extend • Clear transitions',
+         fontsize=8, ha='center', style='italic', color='#666')
+
+    save_png(canvas, path)
+    mark_fresh(path, __file__)
+    print(f"✓ State Pattern diagram generated: {path}")
+
+
+if __name__ == '__main__':
+    render()
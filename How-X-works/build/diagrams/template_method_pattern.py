@@ -1,182 +1,202 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
-import numpy as np
-
-# Create figure and axis
-fig, ax = plt.subplots(1, 1, figsize=(14, 10))
-ax.set_xlim(0, 14)
-ax.set_ylim(0, 10)
-ax.axis('off')
-
-# Title
-ax.text(7, 9.5, 'Template Method Pattern Architecture', 
-        fontsize=20, weight='bold', ha='center')
-ax.text(7, 9.0, 'Define algorithm skeleton in base class; let subclasses override specific steps',
-        fontsize=11, ha='center', style='italic', color='#555')
-
-# Color scheme
-color_abstract = '#FFF3B0'
-color_concrete = '#B8E6F0'
-
-# ===== ABSTRACT CLASS =====
-abstract_box = FancyBboxPatch((0.5, 5.0), 4.5, 3.0,
-                             boxstyle="round,pad=0.1", 
-                             edgecolor='#F77F00', facecolor=color_abstract,
-                             linewidth=2.5)
-ax.add_patch(abstract_box)
-ax.text(2.75, 7.75, 'AbstractClass', fontsize=12, ha='center', weight='bold')
-ax.text(2.75, 7.5, '(ReportGenerator)', fontsize=9, ha='center', style='italic', color='#666')
-
-# Template method
-ax.text(0.7, 7.15, 'templateMethod() {', fontsize=10, ha='left', family='monospace', weight='bold', color='#E63946')
-ax.text(1.0, 6.9, 'this.step1();', fontsize=9, ha='left', family='monospace')
-ax.text(1.0, 6.7, 'this.step2();  // abstract', fontsize=9, ha='left', family='monospace', color='#2E86AB')
-ax.text(1.0, 6.5, 'this.step3();  // abstract', fontsize=9, ha='left', family='monospace', color='#2E86AB')
-ax.text(1.0, 6.3, 'if (this.hook()) {', fontsize=9, ha='left', family='monospace')
-ax.text(1.2, 6.1, 'this.step4();', fontsize=9, ha='left', family='monospace')
-ax.text(1.0, 5.9, '}', fontsize=9, ha='left', family='monospace')
-ax.text(0.7, 5.7, '}', fontsize=10, ha='left', family='monospace', weight='bold')
-
-# Methods
-ax.text(0.7, 5.4, 'step1() { }  // Common', fontsize=9, ha='left', family='monospace', color='#52B788')
-ax.text(0.7, 5.2, 'step2() { }  // Abstract', fontsize=9, ha='left', family='monospace', color='#C41E3A')
-ax.text(0.7, 5.0, 'step3() { }  // Abstract', fontsize=9, ha='left', family='monospace', color='#C41E3A')
-ax.text(0.7, 4.8, 'hook() { return true; }  // Hook', fontsize=9, ha='left', family='monospace', color='#9D4EDD')
-ax.text(0.7, 4.6, 'step4() { }  // Common', fontsize=9, ha='left', family='monospace', color='#52B788')
-
-# ===== CONCRETE CLASS A =====
-concreteA = FancyBboxPatch((6.5, 6.0), 3.0, 1.8,
-                          boxstyle="round,pad=0.1", 
-                          edgecolor='#2E86AB', facecolor=color_concrete,
-                          linewidth=2)
-ax.add_patch(concreteA)
-ax.text(8.0, 7.6, 'ConcreteClassA', fontsize=11, ha='center', weight='bold')
-ax.text(8.0, 7.35, '(PDFReport)', fontsize=8, ha='center', style='italic', color='#666')
-ax.text(6.7, 7.0, 'step2() {', fontsize=9, ha='left', family='monospace')
-ax.text(6.9, 6.8, '// PDF-specific', fontsize=8, ha='left', family='monospace', style='italic', color='#666')
-ax.text(6.7, 6.6, '}', fontsize=9, ha='left', family='monospace')
-ax.text(6.7, 6.35, 'step3() {', fontsize=9, ha='left', family='monospace')
-ax.text(6.9, 6.15, '// PDF-specific', fontsize=8, ha='left', family='monospace', style='italic', color='#666')
-ax.text(6.7, 5.95, '}', fontsize=9, ha='left', family='monospace')
-
-# ===== CONCRETE CLASS B =====
-concreteB = FancyBboxPatch((10.0, 6.0), 3.0, 1.8,
-                          boxstyle="round,pad=0.1", 
-                          edgecolor='#2E86AB', facecolor=color_concrete,
-                          linewidth=2)
-ax.add_patch(concreteB)
-ax.text(11.5, 7.6, 'ConcreteClassB', fontsize=11, ha='center', weight='bold')
-ax.text(11.5, 7.35, '(HTMLReport)', fontsize=8, ha='center', style='italic', color='#666')
-ax.text(10.2, 7.0, 'step2() {', fontsize=9, ha='left', family='monospace')
-ax.text(10.4, 6.8, '// HTML-specific', fontsize=8, ha='left', family='monospace', style='italic', color='#666')
-ax.text(10.2, 6.6, '}', fontsize=9, ha='left', family='monospace')
-ax.text(10.2, 6.35, 'step3() {', fontsize=9, ha='left', family='monospace')
-ax.text(10.4, 6.15, '// HTML-specific', fontsize=8, ha='left', family='monospace', style='italic', color='#666')
-ax.text(10.2, 5.95, '}', fontsize=9, ha='left', family='monospace')
-
-# ===== RELATIONSHIPS =====
-
-# Inheritance
-arrow1 = FancyArrowPatch((8.0, 6.0), (2.75, 8.0),
-                        arrowstyle='-|>', mutation_scale=20, 
-                        color='#2E86AB', linewidth=2, linestyle='dashed')
-ax.add_patch(arrow1)
-
-arrow2 = FancyArrowPatch((11.5, 6.0), (2.75, 8.0),
-                        arrowstyle='-|>', mutation_scale=20, 
-                        color='#2E86AB', linewidth=2, linestyle='dashed')
-ax.add_patch(arrow2)
-
-ax.text(5.0, 7.2, 'extends', fontsize=9, style='italic', color='#2E86AB')
-
-# ===== SEQUENCE DIAGRAM =====
-seq_y = 4.5
-ax.text(7, seq_y + 0.5, 'Execution Flow (Template Method)', fontsize=11, ha='center', weight='bold')
-
-seq_box = FancyBboxPatch((0.5, seq_y - 1.8), 13, 2.0,
-                        boxstyle="round,pad=0.05", 
-                        edgecolor='#999', facecolor='#F9F9F9',
-                        linewidth=1.5)
-ax.add_patch(seq_box)
-
-# Client calls template method
-ax.text(0.7, seq_y + 0.1, '1.', fontsize=9, ha='left', weight='bold')
-ax.text(1.0, seq_y + 0.1, 'Client calls', fontsize=8, ha='left')
-ax.text(2.0, seq_y + 0.1, 'concreteA.templateMethod()', fontsize=8, ha='left', family='monospace', color='#E63946')
-
-# Template method executes steps
-ax.text(0.7, seq_y - 0.2, '2.', fontsize=9, ha='left', weight='bold')
-ax.text(1.0, seq_y - 0.2, 'Template method calls', fontsize=8, ha='left')
-ax.text(2.5, seq_y - 0.2, 'step1()', fontsize=8, ha='left', family='monospace', color='#52B788')
-ax.text(3.2, seq_y - 0.2, '(common implementation in base class)', fontsize=7, ha='left', style='italic', color='#666')
-
-ax.text(0.7, seq_y - 0.5, '3.', fontsize=9, ha='left', weight='bold')
-ax.text(1.0, seq_y - 0.5, 'Template method calls', fontsize=8, ha='left')
-ax.text(2.5, seq_y - 0.5, 'step2()', fontsize=8, ha='left', family='monospace', color='#2E86AB')
-ax.text(3.2, seq_y - 0.5, '(overridden in ConcreteClassA)', fontsize=7, ha='left', style='italic', color='#666')
-
-ax.text(0.7, seq_y - 0.8, '4.', fontsize=9, ha='left', weight='bold')
-ax.text(1.0, seq_y - 0.8, 'Template method calls', fontsize=8, ha='left')
-ax.text(2.5, seq_y - 0.8, 'step3()', fontsize=8, ha='left', family='monospace', color='#2E86AB')
-ax.text(3.2, seq_y - 0.8, '(overridden in ConcreteClassA)', fontsize=7, ha='left', style='italic', color='#666')
-
-ax.text(0.7, seq_y - 1.1, '5.', fontsize=9, ha='left', weight='bold')
-ax.text(1.0, seq_y - 1.1, 'Template method calls', fontsize=8, ha='left')
-ax.text(2.5, seq_y - 1.1, 'hook()', fontsize=8, ha='left', family='monospace', color='#9D4EDD')
-ax.text(3.1, seq_y - 1.1, '(returns true)', fontsize=7, ha='left', style='italic', color='#666')
-
-ax.text(0.7, seq_y - 1.4, '6.', fontsize=9, ha='left', weight='bold')
-ax.text(1.0, seq_y - 1.4, 'Template method calls', fontsize=8, ha='left')
-ax.text(2.5, seq_y - 1.4, 'step4()', fontsize=8, ha='left', family='monospace', color='#52B788')
-ax.text(3.2, seq_y - 1.4, '(common implementation in base class)', fontsize=7, ha='left', style='italic', color='#666')
-
-# ===== METHOD TYPES =====
-types_box = FancyBboxPatch((0.5, 0.1), 4.5, 1.2,
-                          boxstyle="round,pad=0.05", 
-                          edgecolor='#666', facecolor='#FAFAFA',
-                          linewidth=1)
-ax.add_patch(types_box)
-ax.text(2.75, 1.15, 'Method Types', fontsize=10, ha='center', weight='bold')
-
-ax.text(0.7, 0.85, 'Template Method:', fontsize=8, ha='left', weight='bold', color='#E63946')
-ax.text(1.8, 0.85, 'Defines algorithm skeleton (final)', fontsize=7, ha='left')
-
-ax.text(0.7, 0.65, 'Abstract Methods:', fontsize=8, ha='left', weight='bold', color='#C41E3A')
-ax.text(1.8, 0.65, 'Must be overridden by subclasses', fontsize=7, ha='left')
-
-ax.text(0.7, 0.45, 'Hook Methods:', fontsize=8, ha='left', weight='bold', color='#9D4EDD')
-ax.text(1.5, 0.45, 'Optional override; default behavior', fontsize=7, ha='left')
-
-ax.text(0.7, 0.25, 'Common Methods:', fontsize=8, ha='left', weight='bold', color='#52B788')
-ax.text(1.7, 0.25, 'Shared implementation in base class', fontsize=7, ha='left')
-
-# ===== KEY BENEFITS =====
-benefits_box = FancyBboxPatch((5.5, 0.1), 4.0, 1.2,
-                             boxstyle="round,pad=0.05", 
-                             edgecolor='#2E7D32', facecolor='#E8F5E9',
-                             linewidth=1)
-ax.add_patch(benefits_box)
-ax.text(7.5, 1.15, 'Key Benefits', fontsize=10, ha='center', weight='bold', color='#2E7D32')
-
-ax.text(5.7, 0.9, '✓ Code reuse (common steps)', fontsize=8, ha='left', color='#2E7D32')
-ax.text(5.7, 0.7, '✓ Guaranteed algorithm structure', fontsize=8, ha='left', color='#2E7D32')
-ax.text(5.7, 0.5, '✓ Inversion of control', fontsize=8, ha='left', color='#2E7D32')
-ax.text(5.7, 0.3, '✓ Easy to extend specific steps', fontsize=8, ha='left', color='#2E7D32')
-
-# ===== HOLLYWOOD PRINCIPLE =====
-hollywood_box = FancyBboxPatch((10.0, 0.1), 3.5, 1.2,
-                              boxstyle="round,pad=0.05", 
-                              edgecolor='#F77F00', facecolor='#FFF9E6',
-                              linewidth=1.5)
-ax.add_patch(hollywood_box)
-ax.text(11.75, 1.15, 'Hollywood Principle', fontsize=10, ha='center', weight='bold', color='#F77F00')
-ax.text(10.2, 0.85, '"Don\'t call us,', fontsize=9, ha='left', style='italic')
-ax.text(10.4, 0.65, 'we\'ll call you"', fontsize=9, ha='left', style='italic')
-ax.text(10.2, 0.4, 'Parent controls flow;', fontsize=7, ha='left', color='#666')
-ax.text(10.2, 0.2, 'child provides implementations', fontsize=7, ha='left', color='#666')
-
-plt.tight_layout()
-plt.savefig('docs/images/template_method_pattern.png', dpi=300, bbox_inches='tight', facecolor='white')
-print("✓ Template Method Pattern diagram generated: docs/images/template_method_pattern.png")
+from matplotlib.figure import Figure
+from matplotlib.patches import FancyArrowPatch
+from matplotlib.collections import PatchCollection
+from matplotlib.font_manager import FontProperties
+
+from _artists import ROUND_TIGHT, rbox
+from _output import is_fresh, mark_fresh, new_canvas, save_png
+
+OUTPUT = 'docs/images/template_method_pattern.png'
+
+# Shared font properties, resolved once instead of per ax.text call
+MONO8 = FontProperties(family='monospace', size=8)
+MONO8_ITALIC = FontProperties(family='monospace', size=8, style='italic')
+MONO9 = FontProperties(family='monospace', size=9)
+MONO10_BOLD = FontProperties(family='monospace', size=10, weight='bold')
+SANS7 = FontProperties(family='sans-serif', size=7)
+SANS7_ITALIC = FontProperties(family='sans-serif', size=7, style='italic')
+SANS8 = FontProperties(family='sans-serif', size=8)
+SANS8_BOLD = FontProperties(family='sans-serif', size=8, weight='bold')
+SANS8_ITALIC = FontProperties(family='sans-serif', size=8, style='italic')
+SANS9_BOLD = FontProperties(family='sans-serif', size=9, weight='bold')
+SANS9_ITALIC = FontProperties(family='sans-serif', size=9, style='italic')
+SANS10_BOLD = FontProperties(family='sans-serif', size=10, weight='bold')
+SANS11_BOLD = FontProperties(family='sans-serif', size=11, weight='bold')
+SANS11_ITALIC = FontProperties(family='sans-serif', size=11, style='italic')
+SANS12_BOLD = FontProperties(family='sans-serif', size=12, weight='bold')
+SANS20_BOLD = FontProperties(family='sans-serif', size=20, weight='bold')
+
+
+def render(path=OUTPUT, force=False):
+    """Draw the Template Method Pattern diagram and save it to path.
+
+    Skips the render when path is already up to date with this script,
+    unless force is set.
+    """
+    if not force and is_fresh(path, __file__):
+        print(f"Template Method Pattern diagram up to date: {path}")
+        return
+
+    # Create figure and axis
+    # Build the figure on a canvas directly (Agg unless $DIAGRAM_BACKEND says
+    # otherwise); nothing here needs pyplot's global figure registry
+    fig = Figure(figsize=(14, 10), dpi=300)
+    canvas = new_canvas(fig)
+    ax = fig.add_subplot(1, 1, 1)
+    ax.set_xlim(0, 14)
+    ax.set_ylim(0, 10)
+    ax.axis('off')
+    # Fixed margins instead of tight_layout/bbox_inches='tight', which cost
+    # an extra full draw to measure the ink extents
+    fig.subplots_adjust(left=0.01, right=0.99, bottom=0.01, top=0.99)
+
+    # Title
+    ax.text(7, 9.5, 'Template Method Pattern Architecture', 
+            fontproperties=SANS20_BOLD, ha='center')
+    ax.text(7, 9.0, 'Define algorithm skeleton in base class; let subclasses override specific steps',
+            fontproperties=SANS11_ITALIC, ha='center', color='#555')
+
+    # Color scheme
+    color_abstract = '#FFF3B0'
+    color_concrete = '#B8E6F0'
+
+    # ===== ABSTRACT CLASS =====
+    abstract_box = rbox((0.5, 5.0), 4.5, 3.0, '#F77F00', color_abstract, lw=2.5)
+    ax.text(2.75, 7.75, 'AbstractClass', fontproperties=SANS12_BOLD, ha='center')
+    ax.text(2.75, 7.5, '(ReportGenerator)', fontproperties=SANS9_ITALIC, ha='center', color='#666')
+
+    # Template method
+    ax.text(0.7, 7.15, 'templateMethod() {', ha='left', fontproperties=MONO10_BOLD, color='#E63946')
+    ax.text(1.0, 6.9, 'this.step1();', ha='left', fontproperties=MONO9)
+    ax.text(1.0, 6.7, 'this.step2();  // abstract', ha='left', fontproperties=MONO9, color='#2E86AB')
+    ax.text(1.0, 6.5, 'this.step3();  // abstract', ha='left', fontproperties=MONO9, color='#2E86AB')
+    ax.text(1.0, 6.3, 'if (this.hook()) {', ha='left', fontproperties=MONO9)
+    ax.text(1.2, 6.1, 'this.step4();', ha='left', fontproperties=MONO9)
+    ax.text(1.0, 5.9, '}', ha='left', fontproperties=MONO9)
+    ax.text(0.7, 5.7, '}', ha='left', fontproperties=MONO10_BOLD)
+
+    # Methods
+    ax.text(0.7, 5.4, 'step1() { }  // Common', ha='left', fontproperties=MONO9, color='#52B788')
+    ax.text(0.7, 5.2, 'step2() { }  // Abstract', ha='left', fontproperties=MONO9, color='#C41E3A')
+    ax.text(0.7, 5.0, 'step3() { }  // Abstract', ha='left', fontproperties=MONO9, color='#C41E3A')
+    ax.text(0.7, 4.8, 'hook() { return true; }  // Hook', ha='left', fontproperties=MONO9, color='#9D4EDD')
+    ax.text(0.7, 4.6, 'step4() { }  // Common', ha='left', fontproperties=MONO9, color='#52B788')
+
+    # ===== CONCRETE CLASS A =====
+    concreteA = rbox((6.5, 6.0), 3.0, 1.8, '#2E86AB', color_concrete)
+    ax.text(8.0, 7.6, 'ConcreteClassA', fontproperties=SANS11_BOLD, ha='center')
+    ax.text(8.0, 7.35, '(PDFReport)', fontproperties=SANS8_ITALIC, ha='center', color='#666')
+    ax.text(6.7, 7.0, 'step2() {', ha='left', fontproperties=MONO9)
+    ax.text(6.9, 6.8, '// PDF-specific', ha='left', fontproperties=MONO8_ITALIC, color='#666')
+    ax.text(6.7, 6.6, '}', ha='left', fontproperties=MONO9)
+    ax.text(6.7, 6.35, 'step3() {', ha='left', fontproperties=MONO9)
+    ax.text(6.9, 6.15, '// PDF-specific', ha='left', fontproperties=MONO8_ITALIC, color='#666')
+    ax.text(6.7, 5.95, '}', ha='left', fontproperties=MONO9)
+
+    # ===== CONCRETE CLASS B =====
+    concreteB = rbox((10.0, 6.0), 3.0, 1.8, '#2E86AB', color_concrete)
+    ax.text(11.5, 7.6, 'ConcreteClassB', fontproperties=SANS11_BOLD, ha='center')
+    ax.text(11.5, 7.35, '(HTMLReport)', fontproperties=SANS8_ITALIC, ha='center', color='#666')
+    ax.text(10.2, 7.0, 'step2() {', ha='left', fontproperties=MONO9)
+    ax.text(10.4, 6.8, '// HTML-specific', ha='left', fontproperties=MONO8_ITALIC, color='#666')
+    ax.text(10.2, 6.6, '}', ha='left', fontproperties=MONO9)
+    ax.text(10.2, 6.35, 'step3() {', ha='left', fontproperties=MONO9)
+    ax.text(10.4, 6.15, '// HTML-specific', ha='left', fontproperties=MONO8_ITALIC, color='#666')
+    ax.text(10.2, 5.95, '}', ha='left', fontproperties=MONO9)
+
+    # ===== RELATIONSHIPS =====
+
+    # Inheritance
+    arrow1 = FancyArrowPatch((8.0, 6.0), (2.75, 8.0),
+                            arrowstyle='-|>', mutation_scale=20, 
+                            color='#2E86AB', linewidth=2, linestyle='dashed')
+    ax.add_patch(arrow1)
+
+    arrow2 = FancyArrowPatch((11.5, 6.0), (2.75, 8.0),
+                            arrowstyle='-|>', mutation_scale=20, 
+                            color='#2E86AB', linewidth=2, linestyle='dashed')
+    ax.add_patch(arrow2)
+
+    ax.text(5.0, 7.2, 'extends', fontproperties=SANS9_ITALIC, color='#2E86AB')
+
+    # ===== SEQUENCE DIAGRAM =====
+    seq_y = 4.5
+    ax.text(7, seq_y + 0.5, 'Execution Flow (Template Method)', fontproperties=SANS11_BOLD, ha='center')
+
+    seq_box = rbox((0.5, seq_y - 1.8), 13, 2.0, '#999', '#F9F9F9', lw=1.5, boxstyle=ROUND_TIGHT)
+
+    # Step numbers and captions as one Text artist per column, anchored on the
+    # baseline of the last row; linespacing keeps the 0.3-unit row pitch
+    ax.text(0.7, seq_y - 1.4, '1.\n2.\n3.\n4.\n5.\n6.', fontproperties=SANS9_BOLD, ha='left',
+            linespacing=2.35)
+    ax.text(1.0, seq_y - 1.4, '\n'.join(['Client calls'] + ['Template method calls'] * 5),
+            fontproperties=SANS8, ha='left', linespacing=2.65)
+
+    # Client calls template method
+    ax.text(2.0, seq_y + 0.1, 'concreteA.templateMethod()', ha='left', fontproperties=MONO8, color='#E63946')
+
+    # Template method executes steps
+    ax.text(2.5, seq_y - 0.2, 'step1()', ha='left', fontproperties=MONO8, color='#52B788')
+    ax.text(3.2, seq_y - 0.2, '(common implementation in base class)', fontproperties=SANS7_ITALIC, ha='left', color='#666')
+
+    ax.text(2.5, seq_y - 0.5, 'step2()', ha='left', fontproperties=MONO8, color='#2E86AB')
+    ax.text(3.2, seq_y - 0.5, '(overridden in ConcreteClassA)', fontproperties=SANS7_ITALIC, ha='left', color='#666')
+
+    ax.text(2.5, seq_y - 0.8, 'step3()', ha='left', fontproperties=MONO8, color='#2E86AB')
+    ax.text(3.2, seq_y - 0.8, '(overridden in ConcreteClassA)', fontproperties=SANS7_ITALIC, ha='left', color='#666')
+
+    ax.text(2.5, seq_y - 1.1, 'hook()', ha='left', fontproperties=MONO8, color='#9D4EDD')
+    ax.text(3.1, seq_y - 1.1, '(returns true)', fontproperties=SANS7_ITALIC, ha='left', color='#666')
+
+    ax.text(2.5, seq_y - 1.4, 'step4()', ha='left', fontproperties=MONO8, color='#52B788')
+    ax.text(3.2, seq_y - 1.4, '(common implementation in base class)', fontproperties=SANS7_ITALIC, ha='left', color='#666')
+
+    # ===== METHOD TYPES =====
+    types_box = rbox((0.5, 0.1), 4.5, 1.2, '#666', '#FAFAFA', lw=1, boxstyle=ROUND_TIGHT)
+    ax.text(2.75, 1.15, 'Method Types', fontproperties=SANS10_BOLD, ha='center')
+
+    ax.text(0.7, 0.85, 'Template Method:', fontproperties=SANS8_BOLD, ha='left', color='#E63946')
+    ax.text(1.8, 0.85, 'Defines algorithm skeleton (final)', fontproperties=SANS7, ha='left')
+
+    ax.text(0.7, 0.65, 'Abstract Methods:', fontproperties=SANS8_BOLD, ha='left', color='#C41E3A')
+    ax.text(1.8, 0.65, 'Must be overridden by subclasses', fontproperties=SANS7, ha='left')
+
+    ax.text(0.7, 0.45, 'Hook Methods:', fontproperties=SANS8_BOLD, ha='left', color='#9D4EDD')
+    ax.text(1.5, 0.45, 'Optional override; default behavior', fontproperties=SANS7, ha='left')
+
+    ax.text(0.7, 0.25, 'Common Methods:', fontproperties=SANS8_BOLD, ha='left', color='#52B788')
+    ax.text(1.7, 0.25, 'Shared implementation in base class', fontproperties=SANS7, ha='left')
+
+    # ===== KEY BENEFITS =====
+    benefits_box = rbox((5.5, 0.1), 4.0, 1.2, '#2E7D32', '#E8F5E9', lw=1, boxstyle=ROUND_TIGHT)
+    ax.text(7.5, 1.15, 'Key Benefits', fontproperties=SANS10_BOLD, ha='center', color='#2E7D32')
+
+    ax.text(5.7, 0.3, '\n'.join([
+        '✓ Code reuse (common steps)',
+        '✓ Guaranteed algorithm structure',
+        '✓ Inversion of control',
+        '✓ Easy to extend specific steps',
+    ]), fontproperties=SANS8, ha='left', color='#2E7D32', linespacing=1.76)
+
+    # ===== HOLLYWOOD PRINCIPLE =====
+    hollywood_box = rbox((10.0, 0.1), 3.5, 1.2, '#F77F00', '#FFF9E6', lw=1.5, boxstyle=ROUND_TIGHT)
+    ax.text(11.75, 1.15, 'Hollywood Principle', fontproperties=SANS10_BOLD, ha='center', color='#F77F00')
+    ax.text(10.2, 0.85, '"Don\'t call us,', fontproperties=SANS9_ITALIC, ha='left')
+    ax.text(10.4, 0.65, 'we\'ll call you"', fontproperties=SANS9_ITALIC, ha='left')
+    ax.text(10.2, 0.2, 'Parent controls flow;\nchild provides implementations',
+            fontproperties=SANS7, ha='left', color='#666', linespacing=2.02)
+
+    # Every box goes down in one collection under the arrows; the limits are
+    # fixed, so the autoscale update is skipped
+    boxes = [abstract_box, concreteA, concreteB, seq_box, types_box, benefits_box,
+             hollywood_box]
+    ax.add_collection(PatchCollection(boxes, match_original=True, zorder=0.5),
+                      autolim=False)
+
+    save_png(canvas, path)
+    mark_fresh(path, __file__)
+    print(f"✓ Template Method Pattern diagram generated: {path}")
+
 
+if __name__ == '__main__':
+    render()
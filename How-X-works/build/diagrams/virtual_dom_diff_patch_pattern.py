@@ -1,55 +1,33 @@
 #!/usr/bin/env python3
 # ./build/diagrams/virtual_dom_diff_patch_pattern.py
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch, Circle, Rectangle
-import numpy as np
-
-fig, ax = plt.subplots(1, 1, figsize=(16, 11))
-ax.set_xlim(0, 16)
-ax.set_ylim(0, 11)
-ax.axis('off')
-
-# Title
-ax.text(8, 10.5, 'Virtual DOM Diff-Patch Pattern', 
-        fontsize=20, weight='bold', ha='center')
-ax.text(8, 10.0, 'Efficient DOM Updates Through In-Memory Representation',
-        fontsize=12, ha='center', style='italic', color='gray')
-
-# ============= Phase 1: Render Virtual DOM =============
-ax.text(2, 9.3, 'Phase 1: Render', fontsize=11, weight='bold', color='#3b82f6')
-
-component_box = FancyBboxPatch((0.5, 8), 3, 1,
-                                boxstyle="round,pad=0.1",
-                                edgecolor='#3b82f6', facecolor='#dbeafe', linewidth=2)
-ax.add_patch(component_box)
-ax.text(2, 8.7, 'Component', fontsize=10, weight='bold', ha='center')
-ax.text(2, 8.35, 'render(state)', fontsize=8, ha='center', family='monospace')
-
-vdom_box = FancyBboxPatch((4.5, 8), 3, 1,
-                           boxstyle="round,pad=0.1",
-                           edgecolor='#8b5cf6', facecolor='#f3e8ff', linewidth=2)
-ax.add_patch(vdom_box)
-ax.text(6, 8.7, 'Virtual DOM', fontsize=10, weight='bold', ha='center', color='#6b21a8')
-ax.text(6, 8.35, 'JS Object Tree', fontsize=8, ha='center', family='monospace', style='italic')
-
-arrow1 = FancyArrowPatch((3.5, 8.5), (4.5, 8.5),
-                         arrowstyle='->', mutation_scale=20,
-                         linewidth=2, color='#3b82f6')
-ax.add_patch(arrow1)
-ax.text(4, 8.8, 'creates', fontsize=7, ha='center', style='italic')
-
-# ============= Virtual DOM Trees =============
-ax.text(8, 8.5, 'Virtual DOM Representation:', fontsize=10, weight='bold', color='#8b5cf6')
-
-# Old VTree
-old_vtree_box = FancyBboxPatch((0.5, 5.5), 4.5, 2.2,
-                                boxstyle="round,pad=0.1",
-                                edgecolor='#f59e0b', facecolor='#fef3c7', linewidth=2)
-ax.add_patch(old_vtree_box)
-ax.text(2.75, 7.5, 'Old Virtual Tree', fontsize=10, weight='bold', ha='center', color='#92400e')
-
-old_vdom = """{
+from matplotlib.patches import FancyArrowPatch
+from matplotlib.collections import PatchCollection
+from matplotlib.font_manager import FontProperties
+
+from _artists import rbox
+from _output import is_fresh, mark_fresh, new_canvas, save_png
+
+OUTPUT = 'docs/images/virtual_dom_diff_patch_pattern.png'
+
+# Shared font properties, resolved once instead of per ax.text call
+MONO6 = FontProperties(family='monospace', size=6)
+MONO7 = FontProperties(family='monospace', size=7)
+MONO8 = FontProperties(family='monospace', size=8)
+MONO8_ITALIC = FontProperties(family='monospace', size=8, style='italic')
+SANS7 = FontProperties(family='sans-serif', size=7)
+SANS7_ITALIC = FontProperties(family='sans-serif', size=7, style='italic')
+SANS8_BOLD = FontProperties(family='sans-serif', size=8, weight='bold')
+SANS8_ITALIC = FontProperties(family='sans-serif', size=8, style='italic')
+SANS9_ITALIC = FontProperties(family='sans-serif', size=9, style='italic')
+SANS10_BOLD = FontProperties(family='sans-serif', size=10, weight='bold')
+SANS11_BOLD = FontProperties(family='sans-serif', size=11, weight='bold')
+SANS12_ITALIC = FontProperties(family='sans-serif', size=12, style='italic')
+SANS20_BOLD = FontProperties(family='sans-serif', size=20, weight='bold')
+
+# Multi-line text blocks; module level keeps their literal indentation intact
+OLD_VDOM = """{
   tag: 'div',
   props: { id: 'app' },
   children: [
@@ -59,16 +37,8 @@ old_vdom = """{
       children: ['Count: 5'] }
   ]
 }"""
-ax.text(0.7, 7.3, old_vdom, fontsize=6, ha='left', va='top', family='monospace')
 
-# New VTree
-new_vtree_box = FancyBboxPatch((5.5, 5.5), 4.5, 2.2,
-                                boxstyle="round,pad=0.1",
-                                edgecolor='#10b981', facecolor='#d1fae5', linewidth=2)
-ax.add_patch(new_vtree_box)
-ax.text(7.75, 7.5, 'New Virtual Tree', fontsize=10, weight='bold', ha='center', color='#047857')
-
-new_vdom = """{
+NEW_VDOM = """{
   tag: 'div',
   props: { id: 'app' },
   children: [
@@ -78,19 +48,8 @@ new_vdom = """{
       children: ['Count: 6'] }
   ]
 }"""
-ax.text(5.7, 7.3, new_vdom, fontsize=6, ha='left', va='top', family='monospace')
-
-# ============= Phase 2: Diff Algorithm =============
-ax.text(12, 9.3, 'Phase 2: Diff', fontsize=11, weight='bold', color='#ec4899')
-
-diff_box = FancyBboxPatch((11, 6.5), 4.5, 2.5,
-                           boxstyle="round,pad=0.1",
-                           edgecolor='#ec4899', facecolor='#fce7f3', linewidth=2.5)
-ax.add_patch(diff_box)
-ax.text(13.25, 8.7, 'Diff Algorithm', fontsize=11, weight='bold', ha='center', color='#9f1239')
-ax.text(13.25, 8.35, 'Compare Trees', fontsize=9, ha='center', style='italic')
 
-diff_steps = """1. Compare node types
+DIFF_STEPS = """1. Compare node types
 2. Compare props
 3. Compare children
 4. Find changes:
@@ -98,68 +57,14 @@ diff_steps = """1. Compare node types
    • UPDATE
    • DELETE
    • REPLACE"""
-ax.text(11.2, 8.1, diff_steps, fontsize=7, ha='left', va='top', family='monospace')
-
-# Arrows to diff
-arrow_old_diff = FancyArrowPatch((5, 6.5), (11, 7.5),
-                                 arrowstyle='->', mutation_scale=15,
-                                 linewidth=1.5, color='#f59e0b', linestyle='dashed')
-ax.add_patch(arrow_old_diff)
-
-arrow_new_diff = FancyArrowPatch((10, 6.5), (11, 7.5),
-                                 arrowstyle='->', mutation_scale=15,
-                                 linewidth=1.5, color='#10b981', linestyle='dashed')
-ax.add_patch(arrow_new_diff)
 
-# ============= Phase 3: Patch (Minimal Changes) =============
-ax.text(2, 5, 'Phase 3: Patch', fontsize=11, weight='bold', color='#ef4444')
-
-patches_box = FancyBboxPatch((0.5, 3.2), 5, 1.5,
-                              boxstyle="round,pad=0.1",
-                              edgecolor='#ef4444', facecolor='#fee2e2', linewidth=2)
-ax.add_patch(patches_box)
-ax.text(3, 4.5, 'Patches (Minimal Ops)', fontsize=10, weight='bold', ha='center', color='#991b1b')
-
-patches = """[
+PATCHES = """[
   { type: 'UPDATE_TEXT',
     path: [1, 0],
     value: 'Count: 6' }
 ]"""
-ax.text(0.7, 4.3, patches, fontsize=7, ha='left', va='top', family='monospace', color='#7f1d1d')
-
-# Arrow from diff to patches
-arrow_diff_patch = FancyArrowPatch((11, 7), (5.5, 4.5),
-                                   arrowstyle='->', mutation_scale=20,
-                                   linewidth=2, color='#ec4899')
-ax.add_patch(arrow_diff_patch)
-ax.text(8, 5.5, 'generates', fontsize=8, ha='center', style='italic', color='#9f1239')
-
-# ============= Real DOM =============
-real_dom_box = FancyBboxPatch((6.5, 3.2), 4, 1.5,
-                               boxstyle="round,pad=0.1",
-                               edgecolor='#0ea5e9', facecolor='#e0f2fe', linewidth=2.5)
-ax.add_patch(real_dom_box)
-ax.text(8.5, 4.5, '🌐 Real DOM', fontsize=11, weight='bold', ha='center', color='#0369a1')
-ax.text(8.5, 4.15, '<div id="app">', fontsize=7, ha='center', family='monospace')
-ax.text(8.5, 3.9, '  <h1>Hello</h1>', fontsize=7, ha='center', family='monospace')
-ax.text(8.5, 3.65, '  <p>Count: 6</p>', fontsize=7, ha='center', family='monospace')
-ax.text(8.5, 3.4, '</div>', fontsize=7, ha='center', family='monospace')
-
-# Arrow from patches to real DOM
-arrow_patch_dom = FancyArrowPatch((5.5, 4), (6.5, 4),
-                                  arrowstyle='->', mutation_scale=20,
-                                  linewidth=2.5, color='#ef4444')
-ax.add_patch(arrow_patch_dom)
-ax.text(6, 4.3, 'apply', fontsize=8, ha='center', weight='bold', color='#991b1b')
-
-# ============= Benefits =============
-benefits_box = FancyBboxPatch((0.5, 0.1), 7, 2.9,
-                               boxstyle="round,pad=0.1",
-                               edgecolor='#10b981', facecolor='#d1fae5', linewidth=1.5)
-ax.add_patch(benefits_box)
-ax.text(4, 2.85, '✅ Why Virtual DOM?', fontsize=10, weight='bold', ha='center', color='#047857')
-
-benefits = """✓ Performance: Batch DOM updates (avoid reflows)
+
+BENEFITS = """✓ Performance: Batch DOM updates (avoid reflows)
 ✓ Minimal Changes: Only update what changed
 ✓ Declarative: Describe UI, let framework handle updates
 ✓ Cross-Platform: Same pattern for native (React Native)
@@ -173,16 +78,7 @@ Optimization Techniques:
   • Component memoization (shouldComponentUpdate)
   • Fiber architecture (incremental rendering)"""
 
-ax.text(0.7, 2.6, benefits, fontsize=7, ha='left', va='top')
-
-# ============= Frameworks =============
-frameworks_box = FancyBboxPatch((8, 0.1), 7.5, 2.9,
-                                 boxstyle="round,pad=0.1",
-                                 edgecolor='#8b5cf6', facecolor='#f3e8ff', linewidth=1.5)
-ax.add_patch(frameworks_box)
-ax.text(11.75, 2.85, 'Frameworks Using VDOM:', fontsize=10, weight='bold', ha='center', color='#6b21a8')
-
-frameworks = """• React (pioneer, Fiber reconciliation)
+FRAMEWORKS = """• React (pioneer, Fiber reconciliation)
 • Vue 2 & 3 (with compiler optimization)
 • Preact (lightweight React alternative)
 • Inferno (fast VDOM)
@@ -196,17 +92,148 @@ Diff Algorithms:
   Vue: Optimized with compile-time hints
   Preact: Simplified, smaller runtime"""
 
-ax.text(8.2, 2.6, frameworks, fontsize=7, ha='left', va='top')
 
-# Legend
-legend_elements = [
-    mpatches.Patch(facecolor='#f3e8ff', edgecolor='#8b5cf6', label='Virtual DOM (In-Memory)'),
-    mpatches.Patch(facecolor='#fee2e2', edgecolor='#ef4444', label='Patches (Operations)'),
-    mpatches.Patch(facecolor='#e0f2fe', edgecolor='#0ea5e9', label='Real DOM (Browser)'),
-]
-ax.legend(handles=legend_elements, loc='upper left', fontsize=9, framealpha=0.9)
+def render(path=OUTPUT, force=False):
+    """Draw the Virtual DOM Diff-Patch Pattern diagram and save it to path.
+
+    Skips the render when path is already up to date with this script,
+    unless force is set.
+    """
+    if not force and is_fresh(path, __file__):
+        print(f"Virtual DOM Diff-Patch Pattern diagram up to date: {path}")
+        return
+
+    # Build the figure on a canvas directly (Agg unless $DIAGRAM_BACKEND says
+    # otherwise); nothing here needs pyplot's global figure registry
+    fig = Figure(figsize=(16, 11), dpi=300)
+    canvas = new_canvas(fig)
+    ax = fig.add_subplot(1, 1, 1)
+    ax.set_xlim(0, 16)
+    ax.set_ylim(0, 11)
+    ax.axis('off')
+    # Fixed margins instead of tight_layout/bbox_inches='tight', which cost
+    # an extra full draw to measure the ink extents
+    fig.subplots_adjust(left=0.01, right=0.99, bottom=0.01, top=0.99)
+
+    # Title
+    ax.text(8, 10.5, 'Virtual DOM Diff-Patch Pattern', 
+            fontproperties=SANS20_BOLD, ha='center')
+    ax.text(8, 10.0, 'Efficient DOM Updates Through In-Memory Representation',
+            fontproperties=SANS12_ITALIC, ha='center', color='gray')
+
+    # ============= Phase 1: Render Virtual DOM =============
+    ax.text(2, 9.3, 'Phase 1: Render', fontproperties=SANS11_BOLD, color='#3b82f6')
+
+    component_box = rbox((0.5, 8), 3, 1, '#3b82f6', '#dbeafe')
+    ax.text(2, 8.7, 'Component', fontproperties=SANS10_BOLD, ha='center')
+    ax.text(2, 8.35, 'render(state)', ha='center', fontproperties=MONO8)
+
+    vdom_box = rbox((4.5, 8), 3, 1, '#8b5cf6', '#f3e8ff')
+    ax.text(6, 8.7, 'Virtual DOM', fontproperties=SANS10_BOLD, ha='center', color='#6b21a8')
+    ax.text(6, 8.35, 'JS Object Tree', ha='center', fontproperties=MONO8_ITALIC)
+
+    arrow1 = FancyArrowPatch((3.5, 8.5), (4.5, 8.5),
+                             arrowstyle='->', mutation_scale=20,
+                             linewidth=2, color='#3b82f6')
+    ax.add_patch(arrow1)
+    ax.text(4, 8.8, 'creates', fontproperties=SANS7_ITALIC, ha='center')
+
+    # ============= Virtual DOM Trees =============
+    ax.text(8, 8.5, 'Virtual DOM Representation:', fontproperties=SANS10_BOLD, color='#8b5cf6')
+
+    # Old VTree
+    old_vtree_box = rbox((0.5, 5.5), 4.5, 2.2, '#f59e0b', '#fef3c7')
+    ax.text(2.75, 7.5, 'Old Virtual Tree', fontproperties=SANS10_BOLD, ha='center', color='#92400e')
+
+    ax.text(0.7, 7.3, OLD_VDOM, ha='left', va='top', fontproperties=MONO6)
+
+    # New VTree
+    new_vtree_box = rbox((5.5, 5.5), 4.5, 2.2, '#10b981', '#d1fae5')
+    ax.text(7.75, 7.5, 'New Virtual Tree', fontproperties=SANS10_BOLD, ha='center', color='#047857')
+
+    ax.text(5.7, 7.3, NEW_VDOM, ha='left', va='top', fontproperties=MONO6)
+
+    # ============= Phase 2: Diff Algorithm =============
+    ax.text(12, 9.3, 'Phase 2: Diff', fontproperties=SANS11_BOLD, color='#ec4899')
+
+    diff_box = rbox((11, 6.5), 4.5, 2.5, '#ec4899', '#fce7f3', lw=2.5)
+    ax.text(13.25, 8.7, 'Diff Algorithm', fontproperties=SANS11_BOLD, ha='center', color='#9f1239')
+    ax.text(13.25, 8.35, 'Compare Trees', fontproperties=SANS9_ITALIC, ha='center')
+
+    ax.text(11.2, 8.1, DIFF_STEPS, ha='left', va='top', fontproperties=MONO7)
+
+    # Arrows to diff
+    arrow_old_diff = FancyArrowPatch((5, 6.5), (11, 7.5),
+                                     arrowstyle='->', mutation_scale=15,
+                                     linewidth=1.5, color='#f59e0b', linestyle='dashed')
+    ax.add_patch(arrow_old_diff)
+
+    arrow_new_diff = FancyArrowPatch((10, 6.5), (11, 7.5),
+                                     arrowstyle='->', mutation_scale=15,
+                                     linewidth=1.5, color='#10b981', linestyle='dashed')
+    ax.add_patch(arrow_new_diff)
+
+    # ============= Phase 3: Patch (Minimal Changes) =============
+    ax.text(2, 5, 'Phase 3: Patch', fontproperties=SANS11_BOLD, color='#ef4444')
+
+    patches_box = rbox((0.5, 3.2), 5, 1.5, '#ef4444', '#fee2e2')
+    ax.text(3, 4.5, 'Patches (Minimal Ops)', fontproperties=SANS10_BOLD, ha='center', color='#991b1b')
+
+    ax.text(0.7, 4.3, PATCHES, ha='left', va='top', fontproperties=MONO7, color='#7f1d1d')
+
+    # Arrow from diff to patches
+    arrow_diff_patch = FancyArrowPatch((11, 7), (5.5, 4.5),
+                                       arrowstyle='->', mutation_scale=20,
+                                       linewidth=2, color='#ec4899')
+    ax.add_patch(arrow_diff_patch)
+    ax.text(8, 5.5, 'generates', fontproperties=SANS8_ITALIC, ha='center', color='#9f1239')
+
+    # ============= Real DOM =============
+    real_dom_box = rbox((6.5, 3.2), 4, 1.5, '#0ea5e9', '#e0f2fe', lw=2.5)
+    ax.text(8.5, 4.5, '🌐 Real DOM', fontproperties=SANS11_BOLD, ha='center', color='#0369a1')
+    # One Text artist anchored on the baseline of its last line; linespacing
+    # keeps the 0.25-unit row pitch and each line stays centred
+    ax.text(8.5, 3.4, '<div id="app">\n  <h1>Hello</h1>\n  <p>Count: 6</p>\n</div>',
+            ha='center', fontproperties=MONO7, linespacing=2.52)
+
+    # Arrow from patches to real DOM
+    arrow_patch_dom = FancyArrowPatch((5.5, 4), (6.5, 4),
+                                      arrowstyle='->', mutation_scale=20,
+                                      linewidth=2.5, color='#ef4444')
+    ax.add_patch(arrow_patch_dom)
+    ax.text(6, 4.3, 'apply', fontproperties=SANS8_BOLD, ha='center', color='#991b1b')
+
+    # ============= Benefits =============
+    benefits_box = rbox((0.5, 0.1), 7, 2.9, '#10b981', '#d1fae5', lw=1.5)
+    ax.text(4, 2.85, '✅ Why Virtual DOM?', fontproperties=SANS10_BOLD, ha='center', color='#047857')
+
+    ax.text(0.7, 2.6, BENEFITS, fontproperties=SANS7, ha='left', va='top')
+
+    # ============= Frameworks =============
+    frameworks_box = rbox((8, 0.1), 7.5, 2.9, '#8b5cf6', '#f3e8ff', lw=1.5)
+    ax.text(11.75, 2.85, 'Frameworks Using VDOM:', fontproperties=SANS10_BOLD, ha='center', color='#6b21a8')
+
+    ax.text(8.2, 2.6, FRAMEWORKS, fontproperties=SANS7, ha='left', va='top')
+
+    # Every box goes down in one collection under the arrows; the limits are
+    # fixed, so the autoscale update is skipped
+    boxes = [component_box, vdom_box, old_vtree_box, new_vtree_box, diff_box,
+             patches_box, real_dom_box, benefits_box, frameworks_box]
+    ax.add_collection(PatchCollection(boxes, match_original=True, zorder=0.5),
+                      autolim=False)
+
+    # Legend
+    legend_elements = [
+        mpatches.Patch(facecolor='#f3e8ff', edgecolor='#8b5cf6', label='Virtual DOM (In-Memory)'),
+        mpatches.Patch(facecolor='#fee2e2', edgecolor='#ef4444', label='Patches (Operations)'),
+        mpatches.Patch(facecolor='#e0f2fe', edgecolor='#0ea5e9', label='Real DOM (Browser)'),
+    ]
+    ax.legend(handles=legend_elements, loc='upper left', fontsize=9, framealpha=0.9)
+
+    save_png(canvas, path)
+    mark_fresh(path, __file__)
+    print(f"✓ Virtual DOM Diff-Patch Pattern diagram generated: {path}")
 
-plt.tight_layout()
-plt.savefig('docs/images/virtual_dom_diff_patch_pattern.png', dpi=300, bbox_inches='tight', facecolor='white')
-print("✓ Virtual DOM Diff-Patch Pattern diagram generated successfully")
 
+if __name__ == '__main__':
+    render()
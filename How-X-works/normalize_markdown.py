@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Run the master_output.md clean-up passes with one read and one write:
+- remove Python diagram scripts after snippet images (scripts/remove_python_scripts.py)
+- replace remaining diagram code blocks with PNG references (replace_code_with_png.py)
+- replace <br> tags with newlines (replace_br_tags.py)
+- remove emojis (remove_emojis.py)
+"""
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+from _fileio import atomic_write, mapped
+from remove_emojis import remove_emojis
+from remove_python_scripts import remove_python_scripts
+from replace_br_tags import replace_br_tags
+from replace_code_with_png import replace_code_blocks
+
+PATH = 'master_output.md'
+
+def main():
+    # The passes run in memory, in the order they were run by hand, on the
+    # mapped file; only the final text is written back
+    with mapped(PATH) as content:
+        old_size = len(content)
+        data = remove_python_scripts(content)
+
+    out = io.BytesIO()
+    sections_replaced = replace_code_blocks(data, out)
+    data, br_count = replace_br_tags(out.getvalue())
+    data = remove_emojis(data.decode('utf-8')).encode('utf-8')
+
+    # Write through a temp file next to it, then swap it into place, so a
+    # crash never leaves it half-written
+    with atomic_write(PATH, 'wb') as f:
+        f.write(data)
+
+    print(f"✓ Normalized {PATH}")
+    print(f"  Replaced {sections_replaced} Python code blocks with PNG references")
+    print(f"  Replaced {br_count} <br> tags")
+    print(f"  Old size: {old_size} bytes")
+    print(f"  New size: {len(data)} bytes")
+
+if __name__ == '__main__':
+    main()
@@ -8,36 +8,21 @@ Promote all heading levels in master_output.md:
 """
 import re
 
-# Read the file
-with open('master_output.md', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
+from _fileio import atomic_write
 
-new_lines = []
-for line in lines:
-    # Check if line starts with heading markers
-    if line.startswith('#'):
-        # Count the number of # symbols
-        heading_match = re.match(r'^(#+)\s', line)
-        if heading_match:
-            hashes = heading_match.group(1)
-            # Promote by removing one #
-            if len(hashes) > 1:
-                new_line = line[1:]  # Remove one #
-                new_lines.append(new_line)
-            else:
-                # Already level 1, keep as is
-                new_lines.append(line)
-        else:
-            new_lines.append(line)
-    else:
-        new_lines.append(line)
+PATH = 'master_output.md'
 
-# Write back
-with open('master_output.md', 'w', encoding='utf-8') as f:
-    f.writelines(new_lines)
+# Headings with two or more '#'; level 1 stays as is
+PROMOTE = re.compile(r'#(?=#+\s)')
+
+# Stream the file through a temp file next to it, then swap it into place,
+# so only one line is held in memory and a crash never leaves it half-written
+with atomic_write(PATH, 'w', encoding='utf-8') as out, \
+        open(PATH, 'r', encoding='utf-8') as f:
+    for line in f:
+        out.write(line[1:] if PROMOTE.match(line) else line)
 
 print("✓ Promoted all heading levels in master_output.md")
 print("  ## → #")
 print("  ### → ##")
 print("  #### → ###")
-
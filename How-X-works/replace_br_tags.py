@@ -1,40 +1,41 @@
 #!/usr/bin/env python3
 """
-Replace all <br> tags with actual newlines in master_output.md
+Replace all <br> tags with actual newlines in master_output.md, in place
 """
 
 import re
 
+from _fileio import atomic_write
+
+# Every variation of the tag: <br>, <br/>, <br />, <BR>, etc.
+_BR_RE = re.compile(rb'<br\s*/?\s*>', re.IGNORECASE)
+
+def replace_br_tags(data):
+    """
+    Replace every <br> tag in the UTF-8 bytes data with a newline; return the
+    new bytes and the number of tags replaced
+    """
+    return _BR_RE.subn(b'\n', data)
+
 def main():
     input_file = 'master_output.md'
-    output_file = 'master_output_no_br.md'
-    
-    print(f"Reading {input_file}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Count <br> tags before replacement
-    br_count = len(re.findall(r'<br>', content, re.IGNORECASE))
-    print(f"Found {br_count} <br> tags")
-    
-    print("Replacing <br> tags with newlines...")
-    
-    # Replace all variations of <br> tags
-    # <br>, <br/>, <br />, <BR>, etc.
-    content = re.sub(r'<br\s*/?\s*>', '\n', content, flags=re.IGNORECASE)
     
-    # Verify replacement
-    remaining_br = len(re.findall(r'<br>', content, re.IGNORECASE))
-    print(f"Remaining <br> tags: {remaining_br}")
-    print(f"Replaced: {br_count - remaining_br}")
+    # Stream line by line so only one line of the document is held at a
+    # time; a <br> tag never spans a newline. The tag is ASCII, so lines stay
+    # UTF-8 bytes and are never decoded. The output goes to a temp file next
+    # to the input, which is then swapped into its place
+    print(f"Replacing <br> tags in {input_file}...")
+    br_count = 0
+    with atomic_write(input_file, 'wb') as fout, open(input_file, 'rb') as fin:
+        for line in fin:
+            # Replace all variations of <br> tags, counting them in the same scan
+            line, n = replace_br_tags(line)
+            br_count += n
+            fout.write(line)
     
-    print(f"\nWriting to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(content)
+    print(f"Replaced {br_count} <br> tags")
     
-    print(f"✓ Done! File saved to: {output_file}")
-    print(f"\nTo replace the original file:")
-    print(f"  mv {output_file} {input_file}")
+    print(f"✓ Done! File saved to: {input_file}")
 
 if __name__ == '__main__':
     main()
@@ -1,78 +1,95 @@
 #!/usr/bin/env python3
 """
-Replace Python code blocks in diagram sections with PNG references only
+Replace Python code blocks in diagram sections of master_output.md with PNG
+references only, in place
 """
 
 import re
-import os
+
+from _fileio import atomic_write, mapped
+
+# Pattern to find diagram sections with Python code, matched on raw bytes
+# Match: ## Python Architecture Diagram Snippet OR ## Architecture Diagram
+#        followed by optional blank lines
+#        followed by ```python...``` block
+#        and capture what comes after
+DIAGRAM_SECTION_RE = re.compile(
+    rb'(## (?:Python Architecture Diagram Snippet|Architecture Diagram)\n)\n```python\n(.*?)```\n\n(.*?)(?=\n## |\Z)',
+    re.DOTALL)
+
+# Where a diagram's code names its pattern: the PNG it saves or its own path
+_PNG_RE = re.compile(r'docs/images/(\w+)\.png')
+_PY_RE = re.compile(r'diagrams/(\w+)\.py')
+
+# Opening fences of Python code blocks, counted in the output
+_PY_FENCE_RE = re.compile(rb'```python')
+
+# Markdown image references to rendered diagrams, counted in the output
+_PNG_REF_RE = re.compile(rb'!\[.*?\]\(docs/images/.*?\.png\)')
 
 def extract_pattern_name_from_code(code_block):
     """Extract pattern name from the Python code's filename comment or savefig call"""
-    # Look for ./build/diagrams/<pattern>.py or docs/images/<pattern>.png
-    match = re.search(r'docs/images/(\w+)\.png', code_block)
-    if match:
-        return match.group(1)
-    
-    match = re.search(r'diagrams/(\w+)\.py', code_block)
-    if match:
-        return match.group(1)
-    
-    return None
+    # Look for docs/images/<pattern>.png or ./build/diagrams/<pattern>.py
+    match = _PNG_RE.search(code_block) or _PY_RE.search(code_block)
+    return match.group(1) if match else None
 
-def main():
-    with open('master_output.md', 'r', encoding='utf-8') as f:
-        content = f.read()
+def replace_diagram_section(match):
+    """Return a matched diagram section with its Python code swapped for a PNG reference"""
+    header = match.group(1).decode('utf-8')  # The header line
+    python_code = match.group(2).decode('utf-8')  # The Python code block content
+    after_code = match.group(3).decode('utf-8')  # Content after the code block
     
-    # Pattern to find diagram sections with Python code
-    # Match: ## Python Architecture Diagram Snippet OR ## Architecture Diagram
-    #        followed by optional blank lines
-    #        followed by ```python...``` block
-    #        and capture what comes after
+    # Extract pattern name from code
+    pattern_name = extract_pattern_name_from_code(python_code)
     
-    sections_replaced = 0
+    if not pattern_name:
+        # If we can't find pattern name, just remove the code
+        return f"{header}\n\n{after_code}".encode('utf-8')
     
-    def replace_diagram_section(match):
-        nonlocal sections_replaced
-        header = match.group(1)  # The header line
-        python_code = match.group(2)  # The Python code block content
-        after_code = match.group(3)  # Content after the code block
-        
-        # Extract pattern name from code
-        pattern_name = extract_pattern_name_from_code(python_code)
-        
-        if not pattern_name:
-            # If we can't find pattern name, just remove the code
-            sections_replaced += 1
-            return f"{header}\n\n{after_code}"
-        
-        # Check if there's already a PNG reference in after_code
-        if f'{pattern_name}.png' in after_code[:200]:  # Check first 200 chars
-            # PNG reference already exists, just remove code
-            sections_replaced += 1
-            return f"{header}\n\n{after_code}"
-        
-        # Add PNG reference and remove code
-        sections_replaced += 1
-        png_ref = f"![{pattern_name.replace('_', ' ').title()} Architecture](docs/images/{pattern_name}.png)\n\n"
-        
-        return f"{header}\n\n{png_ref}{after_code}"
+    # Check if there's already a PNG reference in after_code
+    if f'{pattern_name}.png' in after_code[:200]:  # Check first 200 chars
+        # PNG reference already exists, just remove code
+        return f"{header}\n\n{after_code}".encode('utf-8')
     
-    # Regex pattern to match diagram sections with Python code
-    pattern = r'(## (?:Python Architecture Diagram Snippet|Architecture Diagram)\n)\n```python\n(.*?)```\n\n(.*?)(?=\n## |\Z)'
+    # Add PNG reference and remove code
+    png_ref = f"![{pattern_name.replace('_', ' ').title()} Architecture](docs/images/{pattern_name}.png)\n\n"
     
-    modified_content = re.sub(pattern, replace_diagram_section, content, flags=re.DOTALL)
+    return f"{header}\n\n{png_ref}{after_code}".encode('utf-8')
+
+def replace_code_blocks(content, out):
+    """Write content to the binary stream out with every diagram section's
+    Python code replaced; return the number of sections replaced"""
+    # The unchanged stretches between matches are written straight from
+    # content, so a mapped input is never copied whole
+    sections_replaced = 0
+    pos = 0
+    for match in DIAGRAM_SECTION_RE.finditer(content):
+        out.write(content[pos:match.start()])
+        out.write(replace_diagram_section(match))
+        sections_replaced += 1
+        pos = match.end()
+    out.write(content[pos:])
+    return sections_replaced
+
+def main():
+    path = 'master_output.md'
     
-    with open('master_output_with_png.md', 'w', encoding='utf-8') as f:
-        f.write(modified_content)
+    # Map the input and stream the output to a temp file next to it, then
+    # swap that into place: neither the document nor its rewritten copy is
+    # ever held in memory, and a crash never leaves it half-written
+    with atomic_write(path, 'wb') as out, mapped(path) as content:
+        sections_replaced = replace_code_blocks(content, out)
     
     print(f"✓ Replaced {sections_replaced} Python code blocks with PNG references")
     
-    # Count remaining code blocks
-    remaining_python = len(re.findall(r'```python', modified_content))
-    print(f"✓ Remaining Python code blocks (in examples): {remaining_python}")
+    with mapped(path) as modified_content:
+        # Count remaining code blocks
+        remaining_python = len(_PY_FENCE_RE.findall(modified_content))
+        
+        # Count PNG references
+        png_refs = len(_PNG_REF_RE.findall(modified_content))
     
-    # Count PNG references
-    png_refs = len(re.findall(r'!\[.*?\]\(docs/images/.*?\.png\)', modified_content))
+    print(f"✓ Remaining Python code blocks (in examples): {remaining_python}")
     print(f"✓ Total PNG diagram references: {png_refs}")
 
 if __name__ == '__main__':
@@ -7,16 +7,25 @@ This ensures proper rendering and readability.
 import re
 import sys
 
+# List item markers, matched at the start of the stripped line
+_UL_RE = re.compile(r'[-*+]\s')      # -, *, or +
+_OL_RE = re.compile(r'\d+[.)]\s')   # number followed by . or )
+
 def is_list_item(line):
     """Check if a line is a list item."""
     stripped = line.lstrip()
     
+    # Most lines start with a character no list marker can (\d is any
+    # Unicode decimal digit), and skip both matches
+    if not stripped or not (stripped[0] in '-*+' or stripped[0].isdecimal()):
+        return False
+    
     # Unordered list: starts with -, *, or +
-    if re.match(r'^[-*+]\s', stripped):
+    if _UL_RE.match(stripped):
         return True
     
     # Ordered list: starts with number followed by . or )
-    if re.match(r'^\d+[.)]\s', stripped):
+    if _OL_RE.match(stripped):
         return True
     
     return False
@@ -25,40 +34,34 @@ def is_blank_line(line):
     """Check if a line is blank or whitespace only."""
     return line.strip() == ''
 
-def is_code_fence(line):
-    """Check if line is a code fence."""
-    return line.strip().startswith('```')
+# Lines whose stripped text starts with ```, opening or closing a code block
+_FENCE_RE = re.compile(r'^[^\S\n]*```', re.MULTILINE)
+
+# The newline before each list item line; a literal first character lets
+# the scan skip straight from one line break to the next
+_ITEM_BREAK_RE = re.compile(r'\n(?=[^\S\n]*(?:[-*+]|\d+[.)])[^\S\n])')
 
 def add_newlines_before_lists(content):
     """Add blank lines before list items if not already present."""
-    lines = content.split('\n')
+    # The fence lines cut the text into alternating prose and code stretches:
+    # a code stretch runs from its opening fence line up to its closing one,
+    # which starts the next prose stretch, so a list right after a code block
+    # still gets its blank line. Only list items in prose are looked at, and
+    # the text between them is copied over in slices
+    bounds = [0, *(m.start() for m in _FENCE_RE.finditer(content)), len(content)]
     result = []
-    in_code_block = False
-    
-    for i, line in enumerate(lines):
-        # Track code blocks
-        if is_code_fence(line):
-            in_code_block = not in_code_block
-            result.append(line)
-            continue
-        
-        # Don't modify lines inside code blocks
-        if in_code_block:
-            result.append(line)
-            continue
-        
-        # Check if current line is a list item
-        if is_list_item(line):
-            # Check if previous line exists and is not blank
-            if i > 0 and not is_blank_line(lines[i-1]):
-                # Also check that previous line is not a list item (to avoid breaking existing lists)
-                if not is_list_item(lines[i-1]):
-                    # Add a blank line before this list item
-                    result.append('')
-        
-        result.append(line)
-    
-    return '\n'.join(result)
+    pos = 0
+    for start, end in zip(bounds[::2], bounds[1::2]):
+        for match in _ITEM_BREAK_RE.finditer(content, start, end):
+            prev_line = content[content.rfind('\n', 0, match.start()) + 1:match.start()]
+            # Only add a blank line after a non-blank line, and not inside an
+            # existing list
+            if not is_blank_line(prev_line) and not is_list_item(prev_line):
+                result.append(content[pos:match.end()])
+                result.append('\n')
+                pos = match.end()
+    result.append(content[pos:])
+    return ''.join(result)
 
 def process_file(input_file, output_file=None):
     """Process the markdown file."""
@@ -70,12 +73,15 @@ def process_file(input_file, output_file=None):
     with open(input_file, 'r', encoding='utf-8') as f:
         content = f.read()
     
-    print(f"Original lines: {len(content.split(chr(10)))}")
+    # Count lines without splitting the text into a list of them
+    original_lines = content.count('\n') + 1
+    print(f"Original lines: {original_lines}")
     
     # Add newlines before lists
     modified_content = add_newlines_before_lists(content)
     
-    print(f"Modified lines: {len(modified_content.split(chr(10)))}")
+    modified_lines = modified_content.count('\n') + 1
+    print(f"Modified lines: {modified_lines}")
     
     # Write output
     with open(output_file, 'w', encoding='utf-8') as f:
@@ -84,8 +90,6 @@ def process_file(input_file, output_file=None):
     print(f"Output written to: {output_file}")
     
     # Calculate changes
-    original_lines = len(content.split('\n'))
-    modified_lines = len(modified_content.split('\n'))
     added_lines = modified_lines - original_lines
     
     print(f"Added {added_lines} blank lines before list items")
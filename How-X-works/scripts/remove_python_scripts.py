@@ -2,11 +2,13 @@
 """
 Remove Python diagram scripts from master_output.md while keeping the images.
 """
+import os
 import re
+import sys
 
-# Read the file
-with open('master_output.md', 'r', encoding='utf-8') as f:
-    content = f.read()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _fileio import atomic_write, mapped
 
 # Pattern to match:
 # ### Python Architecture Diagram Snippet
@@ -18,24 +20,36 @@ with open('master_output.md', 'r', encoding='utf-8') as f:
 # ```python
 # ... (large code block) ...
 # ```
-pattern = r'(### Python Architecture Diagram Snippet\n\n!\[.*?\]\(.*?\)\n\n\*Figure:.*?\*)\n\n```python\n#.*?```'
+# Compiled once with DOTALL baked in, rather than looked up in re's cache
+# on every call
+SCRIPT_SECTION_RE = re.compile(
+    rb'(### Python Architecture Diagram Snippet\n\n!\[.*?\]\(.*?\)\n\n\*Figure:.*?\*)\n\n```python\n#.*?```',
+    re.DOTALL)
 
 # Replace with just the image and caption (rename section to "Architecture Diagram")
 def replace_func(match):
     text = match.group(1)
     # Rename section
-    text = text.replace('### Python Architecture Diagram Snippet', '### Architecture Diagram')
+    text = text.replace(b'### Python Architecture Diagram Snippet', b'### Architecture Diagram')
     return text
 
-# Apply the replacement
-new_content = re.sub(pattern, replace_func, content, flags=re.DOTALL)
+def remove_python_scripts(content):
+    """Return content (bytes, or a map of them) without the diagram scripts"""
+    return SCRIPT_SECTION_RE.sub(replace_func, content)
 
-# Write back
-with open('master_output.md', 'w', encoding='utf-8') as f:
-    f.write(new_content)
+if __name__ == '__main__':
+    # Apply the replacement to the mapped file rather than a copy read into
+    # memory; the map is closed before the file is rewritten below
+    with mapped('master_output.md') as content:
+        old_size = len(content)
+        new_content = remove_python_scripts(content)
 
-print(f"✓ Removed Python scripts from master_output.md")
-print(f"  Old size: {len(content)} characters")
-print(f"  New size: {len(new_content)} characters")
-print(f"  Saved: {len(content) - len(new_content)} characters")
+    # Write back through a temp file next to it, then swap it into place,
+    # so a crash never leaves it half-written
+    with atomic_write('master_output.md', 'wb') as f:
+        f.write(new_content)
 
+    print(f"✓ Removed Python scripts from master_output.md")
+    print(f"  Old size: {old_size} bytes")
+    print(f"  New size: {len(new_content)} bytes")
+    print(f"  Saved: {old_size - len(new_content)} bytes")
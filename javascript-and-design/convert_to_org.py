@@ -6,72 +6,106 @@ Convert Markdown to Org-mode format while preserving all formatting.
 import re
 import sys
 
+# Block-level patterns, matched once per line
+_YAML_PROP_RE = re.compile(r'^(\w+):\s*(.+)$')
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+_TABLE_SEP_RE = re.compile(r'^\|[\s\-:|]+\|$')
+_DASH_RUN_RE = re.compile(r'-+')
+_HR_RE = re.compile(r'^[\-*_]{3,}$')
+
+# Inline patterns, applied in this order by convert_inline_formatting
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+_BOLD_STAR_RE = re.compile(r'\*\*(.+?)\*\*')
+_BOLD_UNDER_RE = re.compile(r'__(.+?)__')
+_ITAL_STAR_RE = re.compile(r'(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)')
+_ITAL_UNDER_RE = re.compile(r'(?<!_)_(?!_)(.+?)(?<!_)_(?!_)')
+_CODE_RE = re.compile(r'`([^`]+)`')
+_STRIKE_RE = re.compile(r'~~(.+?)~~')
+
+# Code fence lines, opening or closing a block, and the line closing the
+# YAML frontmatter
+_FENCE_RE = re.compile(r'^```.*', re.MULTILINE)
+_YAML_END_RE = re.compile(r'^[^\S\n]*---[^\S\n]*$', re.MULTILINE)
+
 def convert_md_to_org(md_content):
     """Convert Markdown content to Org-mode format."""
-    lines = md_content.split('\n')
     org_lines = []
+    body = md_content
+    
+    # Handle YAML frontmatter
+    first_line, _, rest = md_content.partition('\n')
+    if first_line.strip() == '---':
+        end = _YAML_END_RE.search(rest)
+        if end is None:
+            # Unclosed frontmatter swallows the whole document
+            return ''
+        yaml_properties = {}
+        for line in rest[:end.start()].split('\n'):
+            # Parse YAML property
+            match = _YAML_PROP_RE.match(line)
+            if match:
+                yaml_properties[match.group(1)] = match.group(2).strip('"')
+        # Add properties as Org properties
+        for key, value in yaml_properties.items():
+            org_lines.append(f"#+{key.upper()}: {value}")
+        org_lines.append("")
+        if end.end() == len(rest):
+            return '\n'.join(org_lines)
+        body = rest[end.end() + 1:]
+    
+    # Code blocks are found with one scan for their fence lines; the text
+    # between fences alternates between prose, converted line by line, and
+    # code, which is kept as-is and copied over as a single slice
     in_code_block = False
-    in_yaml_frontmatter = False
     code_language = ""
-    in_table = False
-    yaml_properties = {}
-    i = 0
-    
-    while i < len(lines):
-        line = lines[i]
-        
-        # Handle YAML frontmatter
-        if i == 0 and line.strip() == '---':
-            in_yaml_frontmatter = True
-            i += 1
-            continue
-        
-        if in_yaml_frontmatter:
-            if line.strip() == '---':
-                in_yaml_frontmatter = False
-                # Add properties as Org properties
-                for key, value in yaml_properties.items():
-                    org_lines.append(f"#+{key.upper()}: {value}")
-                org_lines.append("")
-                i += 1
-                continue
+    pos = 0
+    for fence in _FENCE_RE.finditer(body):
+        if fence.start() > pos:
+            # Every line up to the fence, without the newline ending the last
+            chunk = body[pos:fence.start() - 1]
+            if in_code_block:
+                org_lines.append(chunk)
             else:
-                # Parse YAML property
-                match = re.match(r'^(\w+):\s*(.+)$', line)
-                if match:
-                    yaml_properties[match.group(1)] = match.group(2).strip('"')
-                i += 1
-                continue
+                convert_lines(chunk.split('\n'), org_lines)
         
-        # Handle code blocks
-        if line.startswith('```'):
-            if not in_code_block:
-                # Starting code block
-                in_code_block = True
-                code_language = line[3:].strip()
-                if code_language:
-                    org_lines.append(f"#+BEGIN_SRC {code_language}")
-                else:
-                    org_lines.append("#+BEGIN_EXAMPLE")
+        if not in_code_block:
+            # Starting code block
+            in_code_block = True
+            code_language = fence.group()[3:].strip()
+            if code_language:
+                org_lines.append(f"#+BEGIN_SRC {code_language}")
             else:
-                # Ending code block
-                in_code_block = False
-                if code_language:
-                    org_lines.append("#+END_SRC")
-                else:
-                    org_lines.append("#+END_EXAMPLE")
-                code_language = ""
-            i += 1
-            continue
-        
-        # If inside code block, keep as-is
+                org_lines.append("#+BEGIN_EXAMPLE")
+        else:
+            # Ending code block
+            in_code_block = False
+            if code_language:
+                org_lines.append("#+END_SRC")
+            else:
+                org_lines.append("#+END_EXAMPLE")
+            code_language = ""
+        pos = fence.end() + 1
+    
+    # The lines after the last fence, unless it ended the document
+    if pos <= len(body):
+        chunk = body[pos:]
         if in_code_block:
-            org_lines.append(line)
-            i += 1
-            continue
+            org_lines.append(chunk)
+        else:
+            convert_lines(chunk.split('\n'), org_lines)
+    
+    return '\n'.join(org_lines)
+
+def convert_lines(lines, org_lines):
+    """Convert lines of Markdown outside code blocks and frontmatter,
+    appending the Org-mode lines to org_lines."""
+    i = 0
+    
+    while i < len(lines):
+        line = lines[i]
         
         # Handle headings
-        heading_match = re.match(r'^(#{1,6})\s+(.+)$', line)
+        heading_match = _HEADING_RE.match(line)
         if heading_match:
             level = len(heading_match.group(1))
             title = heading_match.group(2)
@@ -81,17 +115,19 @@ def convert_md_to_org(md_content):
             i += 1
             continue
         
+        # Stripped once, for both the table and the horizontal rule test
+        stripped = line.strip()
+        
         # Handle tables
-        if '|' in line and line.strip().startswith('|'):
+        if stripped.startswith('|'):
             # This is a table row
             org_lines.append(line)
             # Check if next line is a separator
-            if i + 1 < len(lines) and re.match(r'^\|[\s\-:|]+\|$', lines[i + 1]):
+            if i + 1 < len(lines) and _TABLE_SEP_RE.match(lines[i + 1]):
                 # Convert separator line
                 separator = lines[i + 1]
                 # In org-mode, we use |--+--| style separators
-                separator = re.sub(r'-+', '-', separator)
-                separator = re.sub(r'\|', '|', separator)
+                separator = _DASH_RUN_RE.sub('-', separator)
                 org_lines.append(separator)
                 i += 2
                 continue
@@ -99,7 +135,7 @@ def convert_md_to_org(md_content):
             continue
         
         # Handle horizontal rules
-        if re.match(r'^[\-*_]{3,}$', line.strip()):
+        if _HR_RE.match(stripped):
             org_lines.append('-----')
             i += 1
             continue
@@ -108,31 +144,39 @@ def convert_md_to_org(md_content):
         converted_line = convert_inline_formatting(line)
         org_lines.append(converted_line)
         i += 1
-    
-    return '\n'.join(org_lines)
 
 def convert_inline_formatting(text):
     """Convert inline Markdown formatting to Org-mode."""
+    # Each pass reads the output of the one before, so they stay separate;
+    # a pass only runs when the text holds the literal its pattern needs,
+    # which is a plain substring check and skips most of them on most lines
     
     # Handle links [text](url) -> [[url][text]]
-    text = re.sub(r'\[([^\]]+)\]\(([^\)]+)\)', r'[[\2][\1]]', text)
+    if '](' in text:
+        text = _LINK_RE.sub(r'[[\2][\1]]', text)
     
     # Handle bold **text** or __text__ -> *text*
     # But need to be careful not to convert code or other special cases
-    text = re.sub(r'\*\*(.+?)\*\*', r'*\1*', text)
-    text = re.sub(r'__(.+?)__', r'*\1*', text)
+    if '**' in text:
+        text = _BOLD_STAR_RE.sub(r'*\1*', text)
+    if '__' in text:
+        text = _BOLD_UNDER_RE.sub(r'*\1*', text)
     
     # Handle italic *text* or _text_ -> /text/
     # This is tricky because * is also used for bold
     # We need to handle single * carefully
-    text = re.sub(r'(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)', r'/\1/', text)
-    text = re.sub(r'(?<!_)_(?!_)(.+?)(?<!_)_(?!_)', r'/\1/', text)
+    if '*' in text:
+        text = _ITAL_STAR_RE.sub(r'/\1/', text)
+    if '_' in text:
+        text = _ITAL_UNDER_RE.sub(r'/\1/', text)
     
     # Handle inline code `code` -> =code=
-    text = re.sub(r'`([^`]+)`', r'=\1=', text)
+    if '`' in text:
+        text = _CODE_RE.sub(r'=\1=', text)
     
     # Handle strikethrough ~~text~~ -> +text+
-    text = re.sub(r'~~(.+?)~~', r'+\1+', text)
+    if '~~' in text:
+        text = _STRIKE_RE.sub(r'+\1+', text)
     
     return text
 
@@ -151,8 +195,8 @@ def main():
         f.write(org_content)
     
     print(f"Conversion complete! Output saved to {output_file}")
-    print(f"Original lines: {len(md_content.split(chr(10)))}")
-    print(f"Converted lines: {len(org_content.split(chr(10)))}")
+    print(f"Original lines: {md_content.count(chr(10)) + 1}")
+    print(f"Converted lines: {org_content.count(chr(10)) + 1}")
 
 if __name__ == '__main__':
     main()
@@ -4,22 +4,27 @@ Generate unique architectural diagrams for each chapter.
 Each diagram represents the specific problem's architecture/flow.
 """
 
+import bisect
+import hashlib
+import importlib.util
 import os
+import re
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def install_dependencies():
     """Check and install required dependencies."""
-    try:
-        import graphviz
-    except ImportError:
+    if importlib.util.find_spec('graphviz') is None:
         print("ERROR: python3-graphviz not found.")
         print("\nTo install, run:")
         print("  sudo apt-get update")
         print("  sudo apt-get install graphviz python3-graphviz")
         return False
     
-    if os.system("which dot > /dev/null 2>&1") != 0:
+    if shutil.which('dot') is None:
         print("WARNING: Graphviz system package not found.")
         print("Install with: sudo apt-get install graphviz")
         return False
@@ -373,7 +378,7 @@ def create_pdf_architecture():
         return None
 
 def save_diagram(diagram, filename, output_dir='diagrams'):
-    """Save diagram to file."""
+    """Save diagram to file, unless it is already rendered from the same DOT source."""
     if diagram is None:
         return False
     
@@ -381,9 +386,25 @@ def save_diagram(diagram, filename, output_dir='diagrams'):
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
         
-        # Save diagram
-        output_path = os.path.join(output_dir, filename.replace('.png', ''))
-        diagram.render(output_path, format='png', cleanup=True)
+        # Skip the render when the PNG's sidecar holds this DOT source's hash
+        png_path = os.path.join(output_dir, filename)
+        source_hash = hashlib.sha256(diagram.source.encode('utf-8')).hexdigest()
+        try:
+            with open(png_path + '.hash') as f:
+                if os.path.exists(png_path) and f.read().strip() == source_hash:
+                    print(f"  ✓ Up to date: {output_dir}/{filename}")
+                    return True
+        except OSError:
+            pass
+        
+        # Save diagram; pipe() feeds the DOT source to `dot` on stdin and
+        # returns the PNG, where render() would write a .gv file to run it on
+        # and then delete it
+        png = diagram.pipe(format='png')
+        with open(png_path, 'wb') as f:
+            f.write(png)
+        with open(png_path + '.hash', 'w') as f:
+            f.write(source_hash + '\n')
         
         print(f"  ✓ Generated: {output_dir}/{filename}")
         return True
@@ -391,115 +412,139 @@ def save_diagram(diagram, filename, output_dir='diagrams'):
         print(f"  ✗ Failed to save {filename}: {e}")
         return False
 
+# Define insertions: section heading -> diagram path
+PRIMARY_INSERTIONS = {
+    '# Virtualized Infinite List with Dynamic Heights': 'virtuallist-architecture.png',
+    '# High-Fidelity Pixel-Perfect Zoomable Canvas': 'canvas-architecture.png',
+    '# Reactive Formulas Engine (Spreadsheet-like)': 'reactive-engine-architecture.png',
+    '# DOM-Based Spreadsheet Renderer (Excel Clone)': 'spreadsheet-architecture.png',
+    '# High-Volume Real-Time Charts with Backfill': 'charts-architecture.png',
+    '# ContentEditable Rich-Text Editor with Undo/Redo': 'editor-architecture.png',
+    '# Browser-Native PDF Viewer with Annotations': 'pdf-architecture.png',
+}
+
+# Sub-heading that gets the current section's diagram as well
+ARCHITECTURE_OVERVIEW = '**Architecture Overview**:'
+
+# Lines that get a diagram, each matched as the whole line after str.strip():
+# the section headings and the overview sentinel
+_MARKER_RE = re.compile(
+    r'^[^\S\n]*(?:(?P<heading>' + '|'.join(map(re.escape, PRIMARY_INSERTIONS)) + r')'
+    r'|(?P<overview>' + re.escape(ARCHITECTURE_OVERVIEW) + r'))[^\S\n]*$',
+    re.MULTILINE)
+# Code fence lines, whose stripped form starts with ```
+_FENCE_RE = re.compile(r'^[^\S\n]*```', re.MULTILINE)
+# The rest of a line that holds nothing but whitespace
+_BLANK_LINE_RE = re.compile(r'[^\S\n]*(?:\n|\Z)')
+
 def replace_ascii_diagrams_with_images(markdown_file, output_file=None, diagram_dir='diagrams'):
     """Insert diagram images after specific section headings."""
     if output_file is None:
         output_file = markdown_file
 
     with open(markdown_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    # Define insertions: section heading -> diagram path
-    primary_insertions = {
-        '# Virtualized Infinite List with Dynamic Heights': 'virtuallist-architecture.png',
-        '# High-Fidelity Pixel-Perfect Zoomable Canvas': 'canvas-architecture.png',
-        '# Reactive Formulas Engine (Spreadsheet-like)': 'reactive-engine-architecture.png',
-        '# DOM-Based Spreadsheet Renderer (Excel Clone)': 'spreadsheet-architecture.png',
-        '# High-Volume Real-Time Charts with Backfill': 'charts-architecture.png',
-        '# ContentEditable Rich-Text Editor with Undo/Redo': 'editor-architecture.png',
-        '# Browser-Native PDF Viewer with Annotations': 'pdf-architecture.png',
-    }
+        text = f.read()
 
     current_section = None
-    modified_lines = []
-    i = 0
     inserted_count = 0
-    in_code_block = False
 
-    while i < len(lines):
-        line = lines[i]
+    # Fences are found in one scan up front; a line is inside a code block
+    # when an odd number of fences come before it
+    fence_offsets = [m.start() for m in _FENCE_RE.finditer(text)]
 
-        # Track code blocks
-        if line.strip().startswith('```'):
-            in_code_block = not in_code_block
-
-        modified_lines.append(line)
+    # Only the marker lines are visited; the text between them is written
+    # out as slices of the input, so no per-line strings are created. The
+    # output goes to a temp file next to it, which is then swapped into place
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output_file)), suffix='.md')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as fout:
+            pos = 0
+            for match in _MARKER_RE.finditer(text):
+                heading = match.group('heading')
+                if heading is not None:
+                    # Section heading
+                    current_section = PRIMARY_INSERTIONS[heading]
+                    diagram = current_section
+                    where = f"at: {heading[:50]}..."
+                elif current_section and bisect.bisect_left(fence_offsets, match.start()) % 2 == 0:
+                    # Also insert at "**Architecture Overview**:"
+                    diagram = current_section
+                    where = f"at Architecture Overview for: {current_section}"
+                else:
+                    continue
 
-        # Check if this line matches any section heading
-        for heading, diagram in primary_insertions.items():
-            if line.strip() == heading:
-                current_section = diagram
-                # Skip blank line if present
-                if i + 1 < len(lines) and lines[i + 1].strip() == '':
-                    i += 1
-                    modified_lines.append(lines[i])
+                # Insert after the line, skipping the blank line after it if present
+                end = match.end()
+                if end < len(text):
+                    end += 1
+                    blank = _BLANK_LINE_RE.match(text, end)
+                    if end < len(text) and blank:
+                        end = blank.end()
+                fout.write(text[pos:end])
+                pos = end
 
                 # Insert diagram
                 diagram_path = f'{diagram_dir}/{diagram}'
-                diagram_text = f'\n![Architecture Diagram]({diagram_path})\n\n'
-                modified_lines.append(diagram_text)
+                fout.write(f'\n![Architecture Diagram]({diagram_path})\n\n')
                 inserted_count += 1
-                print(f"  Inserted diagram at: {heading[:50]}...")
-                break
-
-        # Also insert at "**Architecture Overview**:"
-        if not in_code_block and current_section:
-            if line.strip() == '**Architecture Overview**:':
-                # Skip blank line if present
-                if i + 1 < len(lines) and lines[i + 1].strip() == '':
-                    i += 1
-                    modified_lines.append(lines[i])
+                print(f"  Inserted diagram {where}")
 
-                # Insert diagram
-                diagram_path = f'{diagram_dir}/{current_section}'
-                diagram_text = f'\n![Architecture Diagram]({diagram_path})\n\n'
-                modified_lines.append(diagram_text)
-                inserted_count += 1
-                print(f"  Inserted diagram at Architecture Overview for: {current_section}")
-
-        i += 1
-
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.writelines(modified_lines)
+            fout.write(text[pos:])
+        shutil.copymode(markdown_file, tmp)  # mkstemp creates the file 0600
+        os.replace(tmp, output_file)
+    except BaseException:
+        os.unlink(tmp)
+        raise
 
     print(f"Inserted {inserted_count} diagrams total into: {output_file}")
 
 def main():
     """Generate all diagrams."""
+    # --insert-only skips generation and only inserts the image references,
+    # for reruns where the PNGs in diagrams/ are already current
+    args = [arg for arg in sys.argv[1:] if arg != '--insert-only']
+    insert_only = len(args) < len(sys.argv) - 1
+    if insert_only and not args:
+        print("Usage: python3 generate_diagrams.py --insert-only <input_file> [output_file]")
+        return 1
+    
     print("=" * 60)
     print("Generating unique architectural diagrams for each chapter")
     print("=" * 60)
     
-    # Check dependencies
-    if not install_dependencies():
-        print("\nSkipping diagram generation (dependencies not found)")
-        return 1
-    
-    print("\nGenerating diagrams...")
-    
-    # Generate each diagram
-    diagrams = {
-        'virtuallist-architecture.png': create_virtuallist_architecture(),
-        'canvas-architecture.png': create_canvas_architecture(),
-        'charts-architecture.png': create_charts_architecture(),
-        'spreadsheet-architecture.png': create_spreadsheet_architecture(),
-        'reactive-engine-architecture.png': create_reactive_engine_architecture(),
-        'editor-architecture.png': create_editor_architecture(),
-        'pdf-architecture.png': create_pdf_architecture(),
-    }
-    
-    # Save diagrams
-    success_count = 0
-    for filename, diagram in diagrams.items():
-        if save_diagram(diagram, filename):
-            success_count += 1
-    
-    print(f"\n{success_count}/{len(diagrams)} diagrams generated successfully")
+    if not insert_only:
+        # Check dependencies
+        if not install_dependencies():
+            print("\nSkipping diagram generation (dependencies not found)")
+            return 1
+        
+        print("\nGenerating diagrams...")
+        
+        # Generate each diagram
+        diagrams = {
+            'virtuallist-architecture.png': create_virtuallist_architecture(),
+            'canvas-architecture.png': create_canvas_architecture(),
+            'charts-architecture.png': create_charts_architecture(),
+            'spreadsheet-architecture.png': create_spreadsheet_architecture(),
+            'reactive-engine-architecture.png': create_reactive_engine_architecture(),
+            'editor-architecture.png': create_editor_architecture(),
+            'pdf-architecture.png': create_pdf_architecture(),
+        }
+        
+        # Save diagrams; each render waits on its own `dot` subprocess, so
+        # threads overlap them and the total approaches the slowest diagram.
+        # `dot` is CPU-bound, so more workers than cores would only contend
+        workers = min(len(diagrams), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(save_diagram, diagrams.values(), diagrams.keys())
+            success_count = sum(results)
+        
+        print(f"\n{success_count}/{len(diagrams)} diagrams generated successfully")
     
     # Insert diagrams into markdown
-    if len(sys.argv) > 1:
-        input_file = sys.argv[1]
-        output_file = sys.argv[2] if len(sys.argv) > 2 else input_file
+    if args:
+        input_file = args[0]
+        output_file = args[1] if len(args) > 1 else input_file
         
         print(f"\nInserting diagrams into: {output_file}")
         replace_ascii_diagrams_with_images(input_file, output_file)